@@ -14,6 +14,7 @@ from weather.utils.snow import (
     get_snow_ratio,
     calculate_snowfall_from_precip,
     calculate_hourly_snowfall,
+    calculate_hourly_snowfall_arrays,
 )
 
 __version__ = "0.1.0"
@@ -35,5 +36,6 @@ __all__ = [
     "get_snow_ratio",
     "calculate_snowfall_from_precip",
     "calculate_hourly_snowfall",
+    "calculate_hourly_snowfall_arrays",
 ]
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Literal
 
 from weather.domain.errors import ModelError
@@ -31,8 +33,8 @@ class ModelConfig:
     description: str
 
 
-# Registry of supported forecast models
-MODELS: dict[str, ModelConfig] = {
+# Registry of supported forecast models (read-only view)
+MODELS: Mapping[str, ModelConfig] = MappingProxyType({
     "gfs": ModelConfig(
         model_id="gfs",
         api_model="gfs_seamless",
@@ -79,7 +81,7 @@ MODELS: dict[str, ModelConfig] = {
         resolution_degrees=0.25,
         description="Japan Meteorological Agency global model",
     ),
-}
+})
 
 # Model aliases for convenience
 MODEL_ALIASES: dict[str, str] = {
@@ -2,27 +2,35 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta, timezone
 from typing import Any, Union
 
+import numpy as np
+
 from weather.domain.quantities import Quantity, Series
 from weather.domain.errors import RangeError
-from weather.units.convert import convert_value, convert_series
+from weather.units.convert import convert_value, convert_series, convert_temperature
 from weather.units.normalize import normalize_unit
 from weather.utils.geo import coords_are_equivalent
-from weather.utils.time import slice_time_range, resolve_time_offset
-from weather.utils.snow import calculate_hourly_snowfall
+from weather.utils.time import slice_time_range, resolve_time_offset, times_to_epoch
+from weather.utils.snow import calculate_hourly_snowfall_arrays
 
 TimeOffset = Union[datetime, timedelta]
 
 
-@dataclass
+def _cumulative_sum(values: np.ndarray) -> tuple[float, ...]:
+    """Running total of values, treating NaN (missing) as zero."""
+    return tuple(np.cumsum(np.nan_to_num(values, nan=0.0)).tolist())
+
+
+@dataclass(frozen=True, slots=True)
 class Forecast:
     """Weather forecast data for a location.
 
     Contains hourly forecast data, metadata, and methods for accessing
-    weather variables with optional unit conversion.
+    weather variables with optional unit conversion. Instances are
+    immutable; derived series are computed lazily and cached.
 
     Attributes:
         lat: Requested latitude.
@@ -49,25 +57,62 @@ class Forecast:
     hourly_units: dict[str, str]
 
     # Accumulated series (computed lazily)
-    _snowfall_accumulated: tuple[float, ...] | None = field(default=None, repr=False)
-    _precip_accumulated: tuple[float, ...] | None = field(default=None, repr=False)
+    _snowfall_accumulated: tuple[float, ...] | None = field(default=None, init=False, repr=False)
+    _precip_accumulated: tuple[float, ...] | None = field(default=None, init=False, repr=False)
     
     # Enhanced snowfall (computed lazily)
-    _enhanced_snowfall: tuple[float, ...] | None = field(default=None, repr=False)
-    _rain: tuple[float, ...] | None = field(default=None, repr=False)
-    _is_snow: tuple[bool, ...] | None = field(default=None, repr=False)
+    _enhanced_snowfall: np.ndarray | None = field(default=None, init=False, repr=False)
+    _rain: np.ndarray | None = field(default=None, init=False, repr=False)
+    _is_snow: np.ndarray | None = field(default=None, init=False, repr=False)
+
+    # Unix timestamps of times_utc (computed lazily)
+    _times_epoch: np.ndarray | None = field(default=None, init=False, repr=False)
+
+    # Variable name -> (source values, float64 array of them) (computed lazily)
+    _arrays: dict[str, tuple[tuple[float | None, ...], np.ndarray]] | None = field(
+        default=None, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         """Validate and normalize forecast data."""
-        # Ensure times are in UTC
-        if self.times_utc and self.times_utc[0].tzinfo is None:
-            self.times_utc = [
-                t.replace(tzinfo=timezone.utc) for t in self.times_utc
-            ]
+        # Ensure times are in UTC (checking the first is enough: times come
+        # from a single source, so they are all naive or all aware)
+        times = self.times_utc
+        if times and times[0].tzinfo is None:
+            utc = timezone.utc
+            object.__setattr__(self, "times_utc", [t.replace(tzinfo=utc) for t in times])
 
         # Ensure model_run_utc is in UTC
         if self.model_run_utc and self.model_run_utc.tzinfo is None:
-            self.model_run_utc = self.model_run_utc.replace(tzinfo=timezone.utc)
+            object.__setattr__(
+                self, "model_run_utc", self.model_run_utc.replace(tzinfo=timezone.utc)
+            )
+
+    @classmethod
+    def _trusted(cls, **kwargs: Any) -> Forecast:
+        """Create a Forecast from already-normalized data.
+
+        Skips __post_init__, so times_utc and model_run_utc must already
+        be timezone-aware. Intended for internal callers and test fixtures
+        whose data is known to be UTC; user data should go through the
+        regular constructor.
+
+        Raises:
+            TypeError: If a field is missing or an unknown field is given.
+        """
+        obj = cls.__new__(cls)
+        for f in fields(cls):
+            if not f.init:
+                object.__setattr__(obj, f.name, f.default)
+            elif f.name in kwargs:
+                object.__setattr__(obj, f.name, kwargs.pop(f.name))
+            else:
+                raise TypeError(f"Missing required field: '{f.name}'")
+
+        if kwargs:
+            raise TypeError(f"Unexpected fields: {', '.join(sorted(kwargs))}")
+
+        return obj
 
     @property
     def hours_available(self) -> int:
@@ -84,6 +129,66 @@ class Forecast:
         """Last timestamp in the forecast."""
         return self.times_utc[-1] if self.times_utc else None
 
+    def _get_times_epoch(self) -> np.ndarray:
+        """Get times_utc as cached int64 Unix seconds."""
+        times_epoch = self._times_epoch
+        if times_epoch is None:
+            times_epoch = times_to_epoch(self.times_utc)
+            object.__setattr__(self, "_times_epoch", times_epoch)
+
+        return times_epoch
+
+    def _slice_time_range(self, start: TimeOffset, end: TimeOffset) -> tuple[int, int]:
+        """Get the index range for a time window using cached epoch times."""
+        return slice_time_range(
+            start, end, self.times_utc, times_epoch=self._get_times_epoch()
+        )
+
+    def _times_isoformat(self) -> list[str]:
+        """Format times_utc as ISO 8601 strings.
+
+        When every timestamp is UTC on a whole second (the normal case for
+        hourly model output) they are formatted in one vectorized pass from
+        the cached epoch array; otherwise each uses datetime.isoformat().
+        """
+        times = self.times_utc
+        utc = timezone.utc
+        if not times or not all(t.tzinfo is utc and not t.microsecond for t in times):
+            return [t.isoformat() for t in times]
+
+        iso = np.datetime_as_string(self._get_times_epoch().astype("datetime64[us]"), unit="s")
+        return [f"{s}+00:00" for s in iso.tolist()]
+
+    def _get_array(self, variable: str) -> np.ndarray:
+        """Get a variable's raw values as a cached read-only float64 array.
+
+        Missing (None) values become NaN. The cache entry is rebuilt if the
+        variable's entry in hourly_data has been replaced.
+
+        Raises:
+            KeyError: If the variable is not in the forecast.
+        """
+        arrays = self._arrays
+        if arrays is None:
+            arrays = {}
+            object.__setattr__(self, "_arrays", arrays)
+
+        if variable not in self.hourly_data:
+            raise KeyError(f"Variable '{variable}' not in forecast")
+        values = self.hourly_data[variable]
+
+        # hourly_data is a plain dict, so only reuse the array while the
+        # entry is still the same object it was built from
+        cached = arrays.get(variable)
+        if cached is not None and cached[0] is values:
+            return cached[1]
+
+        arr = np.array(values, dtype=np.float64)
+        arr.flags.writeable = False
+        arrays[variable] = (values, arr)
+
+        return arr
+
     # -------------------------------------------------------------------------
     # Hourly series getters
     # -------------------------------------------------------------------------
@@ -194,19 +299,7 @@ class Forecast:
 
     def _compute_accumulated(self, variable: str) -> tuple[float, ...]:
         """Compute cumulative sum for a variable."""
-        if variable not in self.hourly_data:
-            raise KeyError(f"Variable '{variable}' not in forecast")
-
-        values = self.hourly_data[variable]
-        accumulated = []
-        total = 0.0
-
-        for v in values:
-            if v is not None:
-                total += v
-            accumulated.append(total)
-
-        return tuple(accumulated)
+        return _cumulative_sum(self._get_array(variable))
 
     def get_snowfall_accumulated(self, unit: str = "cm") -> Series:
         """Get cumulative snowfall.
@@ -217,11 +310,13 @@ class Forecast:
         Returns:
             Accumulated snowfall series with specified unit.
         """
-        if self._snowfall_accumulated is None:
-            self._snowfall_accumulated = self._compute_accumulated("snowfall")
+        accumulated = self._snowfall_accumulated
+        if accumulated is None:
+            accumulated = self._compute_accumulated("snowfall")
+            object.__setattr__(self, "_snowfall_accumulated", accumulated)
 
         raw_unit = self.hourly_units.get("snowfall", "cm")
-        series = Series(values=self._snowfall_accumulated, unit=raw_unit)
+        series = Series(values=accumulated, unit=raw_unit)
 
         if unit is not None:
             target_unit = normalize_unit(unit)
@@ -238,11 +333,13 @@ class Forecast:
         Returns:
             Accumulated precipitation series with specified unit.
         """
-        if self._precip_accumulated is None:
-            self._precip_accumulated = self._compute_accumulated("precipitation")
+        accumulated = self._precip_accumulated
+        if accumulated is None:
+            accumulated = self._compute_accumulated("precipitation")
+            object.__setattr__(self, "_precip_accumulated", accumulated)
 
         raw_unit = self.hourly_units.get("precipitation", "mm")
-        series = Series(values=self._precip_accumulated, unit=raw_unit)
+        series = Series(values=accumulated, unit=raw_unit)
 
         if unit is not None:
             target_unit = normalize_unit(unit)
@@ -254,10 +351,14 @@ class Forecast:
     # Enhanced snowfall (temperature-based calculation)
     # -------------------------------------------------------------------------
 
-    def _compute_enhanced_snowfall(self) -> None:
-        """Compute enhanced snowfall from precipitation and temperature."""
-        if self._enhanced_snowfall is not None:
-            return  # Already computed
+    def _compute_enhanced_snowfall(self) -> tuple[np.ndarray, np.ndarray]:
+        """Compute enhanced snowfall from precipitation and temperature.
+
+        Returns:
+            The cached read-only (snowfall in cm, rain in mm) float64 arrays.
+        """
+        if self._enhanced_snowfall is not None and self._rain is not None:
+            return self._enhanced_snowfall, self._rain  # Already computed
         
         # Get required data
         precip = self.hourly_data.get("precipitation", ())
@@ -265,10 +366,15 @@ class Forecast:
         freezing_levels = self.hourly_data.get("freezing_level_height", None)
         
         if not precip:
-            self._enhanced_snowfall = ()
-            self._rain = ()
-            self._is_snow = ()
-            return
+            snowfall = np.zeros(0)
+            rain = np.zeros(0)
+            is_snow = np.zeros(0, dtype=bool)
+            for arr in (snowfall, rain, is_snow):
+                arr.flags.writeable = False
+            object.__setattr__(self, "_enhanced_snowfall", snowfall)
+            object.__setattr__(self, "_rain", rain)
+            object.__setattr__(self, "_is_snow", is_snow)
+            return snowfall, rain
         
         # Get units and convert if needed
         precip_unit = self.hourly_units.get("precipitation", "mm")
@@ -283,19 +389,25 @@ class Forecast:
         
         # Convert temperature to Celsius if needed
         if temp_unit != "C" and temp:
-            from weather.units.convert import convert_temperature
             temp = tuple(
                 convert_temperature(v, temp_unit, "C") if v is not None else None
                 for v in temp
             )
         
         # Calculate enhanced snowfall
-        self._enhanced_snowfall, self._rain, self._is_snow = calculate_hourly_snowfall(
+        snowfall, rain, is_snow = calculate_hourly_snowfall_arrays(
             precip_values=precip,
             temp_values=temp,
             freezing_levels=freezing_levels,
             elevation_m=self.elevation_m,
         )
+        for arr in (snowfall, rain, is_snow):
+            arr.flags.writeable = False
+        object.__setattr__(self, "_enhanced_snowfall", snowfall)
+        object.__setattr__(self, "_rain", rain)
+        object.__setattr__(self, "_is_snow", is_snow)
+
+        return snowfall, rain
 
     def get_enhanced_snowfall(self, unit: str = "cm") -> Series:
         """Get enhanced snowfall calculated from precipitation and temperature.
@@ -310,10 +422,10 @@ class Forecast:
         Returns:
             Enhanced snowfall series with specified unit.
         """
-        self._compute_enhanced_snowfall()
+        snowfall, _ = self._compute_enhanced_snowfall()
         
         # Enhanced snowfall is computed in cm
-        series = Series(values=self._enhanced_snowfall, unit="cm")
+        series = Series(values=tuple(snowfall.tolist()), unit="cm")
 
         if unit is not None:
             target_unit = normalize_unit(unit)
@@ -330,10 +442,10 @@ class Forecast:
         Returns:
             Rain series with specified unit.
         """
-        self._compute_enhanced_snowfall()
+        _, rain = self._compute_enhanced_snowfall()
         
         # Rain is computed in mm
-        series = Series(values=self._rain, unit="mm")
+        series = Series(values=tuple(rain.tolist()), unit="mm")
 
         if unit is not None:
             target_unit = normalize_unit(unit)
@@ -350,17 +462,10 @@ class Forecast:
         Returns:
             Accumulated enhanced snowfall series with specified unit.
         """
-        self._compute_enhanced_snowfall()
-        
-        # Compute accumulated
-        accumulated = []
-        total = 0.0
-        for v in self._enhanced_snowfall:
-            if v is not None:
-                total += v
-            accumulated.append(total)
+        snowfall, _ = self._compute_enhanced_snowfall()
         
-        series = Series(values=tuple(accumulated), unit="cm")
+        accumulated = _cumulative_sum(snowfall)
+        series = Series(values=accumulated, unit="cm")
 
         if unit is not None:
             target_unit = normalize_unit(unit)
@@ -384,7 +489,7 @@ class Forecast:
         Returns:
             A Quantity with the total enhanced snowfall.
         """
-        self._compute_enhanced_snowfall()
+        snowfall, _ = self._compute_enhanced_snowfall()
         
         if not self.times_utc:
             raise RangeError("No forecast data available")
@@ -396,11 +501,10 @@ class Forecast:
             end = timedelta(hours=len(self.times_utc))
 
         # Get indices for the range
-        start_idx, end_idx = slice_time_range(start, end, self.times_utc)
+        start_idx, end_idx = self._slice_time_range(start, end)
 
-        # Sum values in range
-        range_values = self._enhanced_snowfall[start_idx:end_idx]
-        total = sum(v for v in range_values if v is not None)
+        # Sum values in range, left to right like the accumulated series
+        total = sum(snowfall[start_idx:end_idx].tolist())
 
         # Convert unit if needed
         target_unit = normalize_unit(unit)
@@ -425,7 +529,7 @@ class Forecast:
         Returns:
             A Quantity with the total rain.
         """
-        self._compute_enhanced_snowfall()
+        _, rain = self._compute_enhanced_snowfall()
         
         if not self.times_utc:
             raise RangeError("No forecast data available")
@@ -437,11 +541,10 @@ class Forecast:
             end = timedelta(hours=len(self.times_utc))
 
         # Get indices for the range
-        start_idx, end_idx = slice_time_range(start, end, self.times_utc)
+        start_idx, end_idx = self._slice_time_range(start, end)
 
-        # Sum values in range
-        range_values = self._rain[start_idx:end_idx]
-        total = sum(v for v in range_values if v is not None)
+        # Sum values in range, left to right like the accumulated series
+        total = sum(rain[start_idx:end_idx].tolist())
 
         # Convert unit if needed
         target_unit = normalize_unit(unit)
@@ -482,18 +585,13 @@ class Forecast:
             end = timedelta(hours=len(self.times_utc))
 
         # Get indices for the range
-        start_idx, end_idx = slice_time_range(start, end, self.times_utc)
-
-        # Get the variable data
-        if variable not in self.hourly_data:
-            raise KeyError(f"Variable '{variable}' not in forecast")
+        start_idx, end_idx = self._slice_time_range(start, end)
 
-        values = self.hourly_data[variable]
+        # Sum values in range over the cached array, skipping missing (NaN) hours
+        values = self._get_array(variable)
         raw_unit = self.hourly_units.get(variable, "undefined")
 
-        # Sum values in range
-        range_values = values[start_idx:end_idx]
-        total = sum(v for v in range_values if v is not None)
+        total = float(np.nansum(values[start_idx:end_idx]))
 
         # Convert unit if needed
         target_unit = normalize_unit(unit)
@@ -615,17 +713,17 @@ class Forecast:
             "model_run_utc": (
                 self.model_run_utc.isoformat() if self.model_run_utc else None
             ),
-            "times_utc": [t.isoformat() for t in self.times_utc],
+            "times_utc": self._times_isoformat(),
             "hourly_data": {k: list(v) for k, v in self.hourly_data.items()},
             "hourly_units": self.hourly_units,
         }
         
         if include_enhanced:
             # Compute and include enhanced snowfall data
-            self._compute_enhanced_snowfall()
+            snowfall, rain = self._compute_enhanced_snowfall()
             result["enhanced_hourly_data"] = {
-                "enhanced_snowfall": list(self._enhanced_snowfall) if self._enhanced_snowfall else [],
-                "rain": list(self._rain) if self._rain else [],
+                "enhanced_snowfall": snowfall.tolist(),
+                "rain": rain.tolist(),
             }
             result["enhanced_hourly_units"] = {
                 "enhanced_snowfall": "cm",
@@ -650,7 +748,7 @@ class Forecast:
 
         times = data.get("times_utc", [])
         if times and isinstance(times[0], str):
-            times = [datetime.fromisoformat(t) for t in times]
+            times = list(map(datetime.fromisoformat, times))
 
         hourly_data = {
             k: tuple(v) for k, v in data.get("hourly_data", {}).items()
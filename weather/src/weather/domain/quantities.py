@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 
 @dataclass(frozen=True, slots=True)
 class Quantity:
@@ -42,11 +44,23 @@ class Series:
     values: tuple[float | None, ...]
     unit: str
 
+    # float64 view of values with NaN for None (computed lazily)
+    _array: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         # Ensure values is a tuple for immutability
         if not isinstance(self.values, tuple):
             object.__setattr__(self, "values", tuple(self.values))
 
+    def _get_array(self) -> np.ndarray:
+        """Get the values as a cached read-only float64 array (None becomes NaN)."""
+        arr = self._array
+        if arr is None:
+            arr = np.array(self.values, dtype=np.float64)
+            arr.flags.writeable = False
+            object.__setattr__(self, "_array", arr)
+        return arr
+
     def __len__(self) -> int:
         return len(self.values)
 
@@ -57,12 +71,15 @@ class Series:
         return result
 
     def __repr__(self) -> str:
-        n = len(self.values)
-        if n <= 6:
-            preview = str(list(self.values))
+        values = self.values
+        n = len(values)
+        if n > 6:
+            # Head, ellipsis, tail
+            parts = [str(values[0]), str(values[1]), "...", str(values[-1])]
         else:
-            preview = f"[{self.values[0]}, {self.values[1]}, ..., {self.values[-1]}]"
-        return f"Series({preview}, unit='{self.unit}', n={n})"
+            parts = [str(v) for v in values]
+        preview = ", ".join(parts)
+        return f"Series([{preview}], unit='{self.unit}', n={n})"
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -74,26 +91,22 @@ class Series:
 
     def sum(self) -> float:
         """Sum all non-None values in the series."""
-        return sum(v for v in self.values if v is not None)
+        return float(np.nansum(self._get_array()))
 
     def mean(self) -> float | None:
         """Calculate the mean of non-None values."""
-        valid = [v for v in self.values if v is not None]
-        if not valid:
+        arr = self._get_array()
+        if np.isnan(arr).all():
             return None
-        return sum(valid) / len(valid)
+        return float(np.nanmean(arr))
 
     def min(self) -> float | None:
         """Return the minimum non-None value."""
-        valid = [v for v in self.values if v is not None]
-        if not valid:
-            return None
-        return min(valid)
+        # fmin skips NaN; the NaN initial value survives only if nothing is valid
+        result = np.fmin.reduce(self._get_array(), initial=np.nan)
+        return None if np.isnan(result) else float(result)
 
     def max(self) -> float | None:
         """Return the maximum non-None value."""
-        valid = [v for v in self.values if v is not None]
-        if not valid:
-            return None
-        return max(valid)
-
+        result = np.fmax.reduce(self._get_array(), initial=np.nan)
+        return None if np.isnan(result) else float(result)
@@ -6,6 +6,8 @@ import logging
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
+
 from weather.config.defaults import DEFAULT_HOURLY_VARIABLES
 from weather.domain.errors import ApiError
 from weather.domain.forecast import Forecast
@@ -78,6 +80,19 @@ def parse_openmeteo_response(
         raise ApiError(f"Failed to parse response: {e}")
 
 
+def _nan_to_none(values_array: Any) -> tuple[float | None, ...]:
+    """Convert a numeric array to a tuple of floats with NaN as None.
+
+    The NaN check and float conversion are done on the whole array; only
+    the (usually few) missing positions are patched in Python.
+    """
+    arr = np.asarray(values_array, dtype=np.float64)
+    values = arr.tolist()
+    for idx in np.flatnonzero(np.isnan(arr)).tolist():
+        values[idx] = None
+    return tuple(values)
+
+
 def _parse_flatbuffers_response(
     response: Any,
     requested_lat: float,
@@ -135,13 +150,7 @@ def _parse_flatbuffers_response(
             variable = hourly.Variables(i)
             if variable is not None:
                 # Get values as numpy array, convert to tuple
-                values_array = variable.ValuesAsNumpy()
-                # Handle NaN values (convert to None)
-                values = tuple(
-                    None if (v != v) else float(v)  # NaN check: v != v
-                    for v in values_array
-                )
-                hourly_data[var_name] = values
+                hourly_data[var_name] = _nan_to_none(variable.ValuesAsNumpy())
 
                 # Get unit - validate it makes sense for this variable
                 default_unit = get_default_unit(var_name)
@@ -2,11 +2,47 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Final
+
+import numpy as np
+
 from weather.domain.errors import UnitError
 from weather.domain.quantities import Series
 from weather.units.normalize import normalize_unit, get_unit_category
 
 
+# Conversion factors to m/s
+_SPEED_TO_MS: Final[Mapping[str, float]] = MappingProxyType({
+    "ms": 1.0,
+    "kmh": 1 / 3.6,
+    "mph": 0.44704,
+    "kn": 0.514444,
+})
+
+# Conversion factors to meters
+_LENGTH_TO_M: Final[Mapping[str, float]] = MappingProxyType({
+    "mm": 0.001,
+    "cm": 0.01,
+    "m": 1.0,
+    "in": 0.0254,
+    "ft": 0.3048,
+})
+
+# (from, to) -> (pre_offset, numerator, denominator, post_offset) such that
+# converted = (value + pre_offset) * numerator / denominator + post_offset.
+# Same arithmetic as converting through Celsius, one step per unit.
+_TEMP_TABLE: Final[Mapping[tuple[str, str], tuple[float, float, float, float]]] = MappingProxyType({
+    ("C", "F"): (0.0, 9.0, 5.0, 32.0),
+    ("C", "K"): (0.0, 1.0, 1.0, 273.15),
+    ("F", "C"): (-32.0, 5.0, 9.0, 0.0),
+    ("F", "K"): (-32.0, 5.0, 9.0, 273.15),
+    ("K", "C"): (-273.15, 1.0, 1.0, 0.0),
+    ("K", "F"): (-273.15, 9.0, 5.0, 32.0),
+})
+
+
 def convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
     """Convert a temperature value between units.
 
@@ -27,26 +63,13 @@ def convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
     if from_canonical == to_canonical:
         return value
 
-    # Validate units are temperature
-    for unit in (from_canonical, to_canonical):
-        if unit not in {"C", "F", "K"}:
-            raise UnitError(f"Not a temperature unit: '{unit}'", unit=unit)
-
-    # Convert to Celsius first
-    if from_canonical == "C":
-        celsius = value
-    elif from_canonical == "F":
-        celsius = (value - 32) * 5 / 9
-    else:  # K
-        celsius = value - 273.15
-
-    # Convert from Celsius to target
-    if to_canonical == "C":
-        return celsius
-    elif to_canonical == "F":
-        return celsius * 9 / 5 + 32
-    else:  # K
-        return celsius + 273.15
+    coeffs = _TEMP_TABLE.get((from_canonical, to_canonical))
+    if coeffs is None:
+        unit = from_canonical if from_canonical not in {"C", "F", "K"} else to_canonical
+        raise UnitError(f"Not a temperature unit: '{unit}'", unit=unit)
+
+    pre_offset, numerator, denominator, post_offset = coeffs
+    return (value + pre_offset) * numerator / denominator + post_offset
 
 
 def convert_speed(value: float, from_unit: str, to_unit: str) -> float:
@@ -71,20 +94,12 @@ def convert_speed(value: float, from_unit: str, to_unit: str) -> float:
 
     # Validate units are speed
     for unit in (from_canonical, to_canonical):
-        if unit not in {"kmh", "ms", "mph", "kn"}:
+        if unit not in _SPEED_TO_MS:
             raise UnitError(f"Not a speed unit: '{unit}'", unit=unit)
 
-    # Conversion factors to m/s
-    to_ms = {
-        "ms": 1.0,
-        "kmh": 1 / 3.6,
-        "mph": 0.44704,
-        "kn": 0.514444,
-    }
-
     # Convert to m/s, then to target
-    ms_value = value * to_ms[from_canonical]
-    return ms_value / to_ms[to_canonical]
+    ms_value = value * _SPEED_TO_MS[from_canonical]
+    return ms_value / _SPEED_TO_MS[to_canonical]
 
 
 def convert_length(value: float, from_unit: str, to_unit: str) -> float:
@@ -109,47 +124,36 @@ def convert_length(value: float, from_unit: str, to_unit: str) -> float:
 
     # Validate units are length
     for unit in (from_canonical, to_canonical):
-        if unit not in {"mm", "cm", "m", "in", "ft"}:
+        if unit not in _LENGTH_TO_M:
             raise UnitError(f"Not a length unit: '{unit}'", unit=unit)
 
-    # Conversion factors to meters
-    to_m = {
-        "mm": 0.001,
-        "cm": 0.01,
-        "m": 1.0,
-        "in": 0.0254,
-        "ft": 0.3048,
-    }
-
     # Convert to meters, then to target
-    m_value = value * to_m[from_canonical]
-    return m_value / to_m[to_canonical]
+    m_value = value * _LENGTH_TO_M[from_canonical]
+    return m_value / _LENGTH_TO_M[to_canonical]
 
 
-def convert_value(
-    value: float,
+# Unit category -> conversion function
+_CONVERTERS: Final[Mapping[str, Callable[[float, str, str], float]]] = MappingProxyType({
+    "temperature": convert_temperature,
+    "speed": convert_speed,
+    "length": convert_length,
+})
+
+
+def _conversion_category(
     from_unit: str,
     to_unit: str,
-) -> float:
-    """Convert a value between units, auto-detecting the category.
-
-    Args:
-        value: The value to convert.
-        from_unit: Source unit.
-        to_unit: Target unit.
+    from_canonical: str,
+    to_canonical: str,
+) -> str:
+    """Check that two different canonical units are convertible.
 
     Returns:
-        The converted value.
+        The shared unit category.
 
     Raises:
         UnitError: If units are incompatible or unknown.
     """
-    from_canonical = normalize_unit(from_unit)
-    to_canonical = normalize_unit(to_unit)
-
-    if from_canonical == to_canonical:
-        return value
-
     # Handle undefined units - cannot convert
     if from_canonical == "undefined":
         raise UnitError(
@@ -171,18 +175,59 @@ def convert_value(
             f"'{from_unit}' ({from_category}) and '{to_unit}' ({to_category})"
         )
 
-    if from_category == "temperature":
-        return convert_temperature(value, from_canonical, to_canonical)
-    elif from_category == "speed":
-        return convert_speed(value, from_canonical, to_canonical)
-    elif from_category == "length":
-        return convert_length(value, from_canonical, to_canonical)
-    else:
+    if from_category not in _CONVERTERS:
         raise UnitError(
             f"No conversion available for category: '{from_category}'",
             unit=from_unit,
         )
 
+    return from_category
+
+
+def _convert_array(
+    values: np.ndarray,
+    category: str,
+    from_canonical: str,
+    to_canonical: str,
+) -> np.ndarray:
+    """Convert an array of values, in the same order of operations as the scalar converters."""
+    if category == "temperature":
+        pre_offset, numerator, denominator, post_offset = _TEMP_TABLE[
+            (from_canonical, to_canonical)
+        ]
+        return (values + pre_offset) * numerator / denominator + post_offset
+
+    factors = _SPEED_TO_MS if category == "speed" else _LENGTH_TO_M
+    return values * factors[from_canonical] / factors[to_canonical]
+
+
+def convert_value(
+    value: float,
+    from_unit: str,
+    to_unit: str,
+) -> float:
+    """Convert a value between units, auto-detecting the category.
+
+    Args:
+        value: The value to convert.
+        from_unit: Source unit.
+        to_unit: Target unit.
+
+    Returns:
+        The converted value.
+
+    Raises:
+        UnitError: If units are incompatible or unknown.
+    """
+    from_canonical = normalize_unit(from_unit)
+    to_canonical = normalize_unit(to_unit)
+
+    if from_canonical == to_canonical:
+        return value
+
+    category = _conversion_category(from_unit, to_unit, from_canonical, to_canonical)
+    return _CONVERTERS[category](value, from_canonical, to_canonical)
+
 
 def convert_series(
     series: Series,
@@ -206,10 +251,13 @@ def convert_series(
     if from_canonical == to_canonical:
         return series
 
-    converted_values = tuple(
-        convert_value(v, from_canonical, to_canonical) if v is not None else None
-        for v in series.values
-    )
+    category = _conversion_category(series.unit, to_unit, from_canonical, to_canonical)
+
+    # One pass over the whole series; missing (NaN) hours stay None
+    arr = np.array(series.values, dtype=np.float64)
+    converted_values = _convert_array(arr, category, from_canonical, to_canonical).tolist()
+    for idx in np.flatnonzero(np.isnan(arr)).tolist():
+        converted_values[idx] = None
 
     return Series(values=converted_values, unit=to_canonical)
 
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final
+
 from weather.domain.errors import UnitError
 
-# Canonical unit tokens used internally
-CANONICAL_UNITS = {
+# Canonical unit tokens used internally (interned, so equal units share one object)
+CANONICAL_UNITS = frozenset(map(sys.intern, {
     # Temperature
     "C",  # Celsius
     "F",  # Fahrenheit
@@ -40,7 +46,7 @@ CANONICAL_UNITS = {
     "gpm",  # geopotential meters
     # Undefined/unknown
     "undefined",
-}
+}))
 
 # Alias mapping to canonical tokens
 UNIT_ALIASES: dict[str, str] = {
@@ -89,9 +95,40 @@ UNIT_ALIASES: dict[str, str] = {
 }
 
 
+# Exact-match lookup: undefined markers, canonical tokens, then aliases.
+# Every value is an interned canonical token.
+_EXACT_UNITS: Final[Mapping[str, str]] = MappingProxyType({
+    **{alias: sys.intern(canonical) for alias, canonical in UNIT_ALIASES.items()},
+    **{unit: unit for unit in CANONICAL_UNITS},
+    "undefined": "undefined",
+    "unknown": "undefined",
+    "": "undefined",
+})
+
+# Case-insensitive alias lookup, keyed by lowercased alias
+_LOWER_ALIASES: Final[Mapping[str, str]] = MappingProxyType(
+    {alias.lower(): sys.intern(canonical) for alias, canonical in UNIT_ALIASES.items()}
+)
+
+# Canonical unit -> category (units without a category are not convertible)
+_UNIT_CATEGORIES: Final[Mapping[str, str]] = MappingProxyType({
+    "undefined": "undefined",
+    **dict.fromkeys(("C", "F", "K"), "temperature"),
+    **dict.fromkeys(("kmh", "ms", "mph", "kn"), "speed"),
+    **dict.fromkeys(("mm", "cm", "m", "in", "ft"), "length"),
+    "%": "percentage",
+    "hPa": "pressure",
+    **dict.fromkeys(("W/m²", "°"), "other"),
+})
+
+
+@lru_cache(maxsize=256)
 def normalize_unit(unit: str) -> str:
     """Normalize a unit string to its canonical token.
 
+    Results are cached, since every conversion normalizes the same few
+    unit strings.
+
     Args:
         unit: The unit string to normalize (e.g., "km/h", "celsius", "°C").
 
@@ -101,21 +138,11 @@ def normalize_unit(unit: str) -> str:
     Raises:
         UnitError: If the unit is not recognized.
     """
-    # Handle undefined/unknown units
-    if unit in ("undefined", "unknown", ""):
-        return "undefined"
-
-    # Check if already canonical
-    if unit in CANONICAL_UNITS:
-        return unit
-
-    # Check aliases
-    normalized = UNIT_ALIASES.get(unit.lower())
+    normalized = _EXACT_UNITS.get(unit)
     if normalized is not None:
         return normalized
 
-    # Try case-sensitive alias lookup
-    normalized = UNIT_ALIASES.get(unit)
+    normalized = _LOWER_ALIASES.get(unit.lower())
     if normalized is not None:
         return normalized
 
@@ -135,22 +162,7 @@ def get_unit_category(unit: str) -> str:
     Raises:
         UnitError: If the unit is not a canonical unit.
     """
-    canonical = normalize_unit(unit)
-
-    if canonical == "undefined":
-        return "undefined"
-    elif canonical in {"C", "F", "K"}:
-        return "temperature"
-    elif canonical in {"kmh", "ms", "mph", "kn"}:
-        return "speed"
-    elif canonical in {"mm", "cm", "m", "in", "ft"}:
-        return "length"
-    elif canonical == "%":
-        return "percentage"
-    elif canonical == "hPa":
-        return "pressure"
-    elif canonical in {"W/m²", "°"}:
-        return "other"
-    else:
+    category = _UNIT_CATEGORIES.get(normalize_unit(unit))
+    if category is None:
         raise UnitError(f"Unknown unit category for: '{unit}'", unit=unit)
-
+    return category
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from weather.units.normalize import normalize_unit
 
 # Open-Meteo hourly_units response strings -> canonical tokens
@@ -79,9 +81,13 @@ FLATBUFFERS_UNIT_ENUM: dict[int, str] = {
 }
 
 
+@lru_cache(maxsize=128, typed=True)
 def decode_openmeteo_unit(unit: str | int) -> str:
     """Decode an Open-Meteo unit to a canonical token.
 
+    Results are cached, since a response repeats the same handful of units
+    for every variable.
+
     Args:
         unit: Either a unit string from the JSON API's hourly_units,
               or an integer enum value from FlatBuffers Variables(i).Unit().
@@ -1,22 +1,31 @@
 """Utility functions for weather data processing."""
 
-from weather.utils.geo import haversine_distance, coords_are_equivalent
+from weather.utils.geo import (
+    haversine_distance,
+    haversine_distance_batch,
+    make_haversine_from,
+    coords_are_equivalent,
+)
 from weather.utils.time import (
     infer_model_run_time,
     resolve_time_offset,
     get_time_index,
     slice_time_range,
     ensure_utc,
+    times_to_epoch,
 )
 from weather.utils.snow import (
     get_snow_ratio,
     calculate_snowfall_from_precip,
     calculate_hourly_snowfall,
+    calculate_hourly_snowfall_arrays,
 )
 
 __all__ = [
     # Geo utilities
     "haversine_distance",
+    "haversine_distance_batch",
+    "make_haversine_from",
     "coords_are_equivalent",
     # Time utilities
     "infer_model_run_time",
@@ -24,9 +33,11 @@ __all__ = [
     "get_time_index",
     "slice_time_range",
     "ensure_utc",
+    "times_to_epoch",
     # Snow utilities
     "get_snow_ratio",
     "calculate_snowfall_from_precip",
     "calculate_hourly_snowfall",
+    "calculate_hourly_snowfall_arrays",
 ]
 
@@ -3,6 +3,16 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Callable
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# Earth's radius in meters
+_EARTH_RADIUS_M = 6_371_000
+
+# Relative slack applied to the cheap lower-bound rejection in coords_are_equivalent
+_BOUND_MARGIN = 1e-9
 
 
 def haversine_distance(
@@ -25,23 +35,90 @@ def haversine_distance(
     Returns:
         Distance in meters.
     """
-    # Earth's radius in meters
-    R = 6_371_000
-
     # Convert to radians
     lat1_rad = math.radians(lat1)
     lat2_rad = math.radians(lat2)
     delta_lat = math.radians(lat2 - lat1)
     delta_lon = math.radians(lon2 - lon1)
 
-    # Haversine formula
+    # Haversine formula (atan2 form stays accurate near antipodal points)
+    sin_half_lat = math.sin(delta_lat * 0.5)
+    sin_half_lon = math.sin(delta_lon * 0.5)
     a = (
-        math.sin(delta_lat / 2) ** 2
-        + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
+        sin_half_lat * sin_half_lat
+        + math.cos(lat1_rad) * math.cos(lat2_rad) * (sin_half_lon * sin_half_lon)
     )
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
-    return R * c
+    return _EARTH_RADIUS_M * c
+
+
+def make_haversine_from(lat0: float, lon0: float) -> Callable[[float, float], float]:
+    """Build a distance function anchored at a fixed reference point.
+
+    The reference point's radians and cosine are computed once, so
+    comparing many points against one anchor skips that work per call.
+    Results match haversine_distance(lat0, lon0, lat, lon).
+
+    Args:
+        lat0: Latitude of the reference point in degrees.
+        lon0: Longitude of the reference point in degrees.
+
+    Returns:
+        A function (lat, lon) -> distance in meters from the reference point.
+    """
+    cos_lat0 = math.cos(math.radians(lat0))
+
+    def distance_from(lat: float, lon: float) -> float:
+        sin_half_lat = math.sin(math.radians(lat - lat0) * 0.5)
+        sin_half_lon = math.sin(math.radians(lon - lon0) * 0.5)
+        a = (
+            sin_half_lat * sin_half_lat
+            + cos_lat0 * math.cos(math.radians(lat)) * (sin_half_lon * sin_half_lon)
+        )
+        return _EARTH_RADIUS_M * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return distance_from
+
+
+def haversine_distance_batch(
+    lat1: ArrayLike,
+    lon1: ArrayLike,
+    lat2: ArrayLike,
+    lon2: ArrayLike,
+) -> np.ndarray:
+    """Calculate great-circle distances for arrays of point pairs.
+
+    Vectorized form of haversine_distance; inputs broadcast against each
+    other, so one point can be compared to many. For a single pair,
+    haversine_distance is faster.
+
+    Args:
+        lat1: Latitudes of the first points in degrees.
+        lon1: Longitudes of the first points in degrees.
+        lat2: Latitudes of the second points in degrees.
+        lon2: Longitudes of the second points in degrees.
+
+    Returns:
+        A float64 array of distances in meters.
+    """
+    lat1 = np.asarray(lat1, dtype=np.float64)
+    lon1 = np.asarray(lon1, dtype=np.float64)
+    lat2 = np.asarray(lat2, dtype=np.float64)
+    lon2 = np.asarray(lon2, dtype=np.float64)
+
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    delta_lat = np.radians(lat2 - lat1)
+    delta_lon = np.radians(lon2 - lon1)
+
+    a = (
+        np.sin(delta_lat / 2) ** 2
+        + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(delta_lon / 2) ** 2
+    )
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return np.asarray(_EARTH_RADIUS_M * c, dtype=np.float64)
 
 
 def coords_are_equivalent(
@@ -64,7 +141,27 @@ def coords_are_equivalent(
     Returns:
         True if the points are within the threshold distance.
     """
-    return haversine_distance(lat1, lon1, lat2, lon2) <= threshold_meters
+    # The meridian arc between the latitudes is a lower bound on the
+    # great-circle distance, so a large latitude gap rejects without the
+    # full haversine. The small margin keeps rounding from flipping a
+    # pair that sits exactly on the threshold.
+    delta_lat = math.radians(lat2 - lat1)
+    if abs(delta_lat) * _EARTH_RADIUS_M > threshold_meters * (1 + _BOUND_MARGIN):
+        return False
+
+    # haversine_distance inlined, reusing delta_lat; same operations in the
+    # same order, so the result is identical
+    sin_half_lat = math.sin(delta_lat * 0.5)
+    sin_half_lon = math.sin(math.radians(lon2 - lon1) * 0.5)
+    a = (
+        sin_half_lat * sin_half_lat
+        + math.cos(math.radians(lat1))
+        * math.cos(math.radians(lat2))
+        * (sin_half_lon * sin_half_lon)
+    )
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return _EARTH_RADIUS_M * c <= threshold_meters
 
 
 def round_coords(lat: float, lon: float, precision: int = 4) -> tuple[float, float]:
@@ -81,6 +178,30 @@ def round_coords(lat: float, lon: float, precision: int = 4) -> tuple[float, flo
     return round(lat, precision), round(lon, precision)
 
 
+def round_coords_batch(
+    lats: ArrayLike,
+    lons: ArrayLike,
+    precision: int = 4,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Round arrays of coordinates to a given decimal precision.
+
+    Vectorized form of round_coords. NumPy rounds via scaling, so a value
+    lying almost exactly halfway can differ from round() in the last place.
+
+    Args:
+        lats: Latitudes in degrees.
+        lons: Longitudes in degrees.
+        precision: Number of decimal places (default 4 ≈ 11m resolution).
+
+    Returns:
+        Tuple of (rounded_lats, rounded_lons) float64 arrays.
+    """
+    return (
+        np.round(np.asarray(lats, dtype=np.float64), precision),
+        np.round(np.asarray(lons, dtype=np.float64), precision),
+    )
+
+
 def normalize_longitude(lon: float) -> float:
     """Normalize longitude to the range [-180, 180].
 
@@ -90,9 +211,14 @@ def normalize_longitude(lon: float) -> float:
     Returns:
         Normalized longitude in [-180, 180].
     """
-    while lon > 180:
-        lon -= 360
-    while lon < -180:
-        lon += 360
-    return lon
+    if -180 <= lon <= 180:
+        return lon
+
+    # Exact IEEE remainder, in [-180, 180] for any number of rotations
+    wrapped = math.remainder(lon, 360.0)
+
+    # Odd multiples of 180 land on either end; keep the input's side
+    if abs(wrapped) == 180.0:
+        return math.copysign(180.0, lon)
+    return wrapped
 
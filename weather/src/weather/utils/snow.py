@@ -6,58 +6,77 @@ using temperature-dependent snow-to-liquid ratios.
 
 from __future__ import annotations
 
+import math
+from typing import Final
+
+import numpy as np
+
+# Temperature at or below which precipitation is treated as snow
+_SNOW_TEMP_THRESHOLD_C: Final[float] = 2.0
+
+# Mixed precipitation zone around the freezing level
+_FREEZING_LEVEL_BUFFER_M: Final[float] = 300.0
+
+# 10mm of water = 1cm of snow at a 10:1 ratio
+_MM_TO_CM_DIVISOR: Final[float] = 10.0
+
+# Reference points: (temperature_celsius, ratio)
+# Sorted from warmest to coldest
+_SNOW_RATIO_POINTS: tuple[tuple[float, float], ...] = (
+    (2.0, 0.0),    # Above freezing threshold - rain
+    (0.0, 8.0),    # Freezing - heavy, wet snow
+    (-3.0, 10.0),  # Just below freezing
+    (-6.0, 12.0),  # Cold
+    (-9.0, 15.0),  # Colder - good powder
+    (-12.0, 18.0), # Very cold - dry powder
+    (-15.0, 20.0), # Extremely cold
+    (-20.0, 25.0), # Arctic cold
+    (-25.0, 30.0), # Ultra-cold "cold smoke"
+)
+
+_RATIO_TEMPS = np.array([t for t, _ in _SNOW_RATIO_POINTS])
+_RATIO_VALUES = np.array([r for _, r in _SNOW_RATIO_POINTS])
+
 
 def get_snow_ratio(temp_c: float) -> float:
     """Get the snow-to-liquid ratio based on temperature.
-    
+
     The ratio represents how many units of snow result from 1 unit of
     liquid water equivalent precipitation. Colder temperatures produce
     lighter, fluffier snow with higher ratios.
-    
+
     Uses linear interpolation between reference points for smooth transitions.
-    
+
     Args:
         temp_c: Temperature in Celsius.
-        
+
     Returns:
         Snow-to-liquid ratio (e.g., 15.0 means 15:1).
-        
+
     References:
         - National Weather Service snow ratio guidelines
         - Roebber et al. (2003) snow-to-liquid ratio climatology
     """
-    # Reference points: (temperature_celsius, ratio)
-    # Sorted from warmest to coldest
-    reference_points = [
-        (2.0, 0.0),    # Above freezing threshold - rain
-        (0.0, 8.0),    # Freezing - heavy, wet snow
-        (-3.0, 10.0),  # Just below freezing
-        (-6.0, 12.0),  # Cold
-        (-9.0, 15.0),  # Colder - good powder
-        (-12.0, 18.0), # Very cold - dry powder
-        (-15.0, 20.0), # Extremely cold
-        (-20.0, 25.0), # Arctic cold
-        (-25.0, 30.0), # Ultra-cold "cold smoke"
-    ]
-    
+    reference_points = _SNOW_RATIO_POINTS
+
     # Above warmest reference point
     if temp_c >= reference_points[0][0]:
         return reference_points[0][1]
-    
+
     # Below coldest reference point
     if temp_c <= reference_points[-1][0]:
         return reference_points[-1][1]
-    
+
     # Find the two reference points to interpolate between
     for i in range(len(reference_points) - 1):
         t1, r1 = reference_points[i]
         t2, r2 = reference_points[i + 1]
-        
+
         if t2 <= temp_c < t1:
             # Linear interpolation: ratio = r1 + (r2 - r1) * (t1 - temp) / (t1 - t2)
             fraction = (t1 - temp_c) / (t1 - t2)
             return r1 + (r2 - r1) * fraction
-    
+
     # Fallback (shouldn't reach here)
     return 10.0
 
@@ -69,16 +88,16 @@ def calculate_snowfall_from_precip(
     elevation_m: float | None = None,
 ) -> tuple[float, bool]:
     """Calculate snowfall from liquid precipitation.
-    
+
     Uses temperature-dependent snow-to-liquid ratios to convert
     liquid precipitation to snowfall depth.
-    
+
     Args:
         precip_mm: Precipitation in millimeters (liquid water equivalent).
         temp_c: Temperature in Celsius at the location.
         freezing_level_m: Optional freezing level height in meters.
         elevation_m: Optional elevation of the location in meters.
-        
+
     Returns:
         Tuple of (snowfall_cm, is_snow) where:
         - snowfall_cm: Calculated snowfall in centimeters
@@ -86,40 +105,127 @@ def calculate_snowfall_from_precip(
     """
     if precip_mm is None or precip_mm <= 0:
         return 0.0, False
-    
+
     if temp_c is None:
         # No temperature data - use conservative 10:1 ratio
-        return precip_mm / 10.0, True
-    
+        return precip_mm / _MM_TO_CM_DIVISOR, True
+
+    return _calc_snow_fast(
+        precip_mm,
+        temp_c,
+        math.nan if freezing_level_m is None else freezing_level_m,
+        math.nan if elevation_m is None else elevation_m,
+    )
+
+
+def _calc_snow_fast(
+    precip: float,
+    temp: float,
+    fl: float,
+    elev: float,
+) -> tuple[float, bool]:
+    """Unchecked core of calculate_snowfall_from_precip.
+
+    Assumes precip > 0 and a non-None temperature. Missing freezing level
+    or elevation is passed as NaN rather than None.
+    """
     # Determine if precipitation is snow or rain
-    is_snow = temp_c <= 2  # Snow threshold
-    
+    is_snow = temp <= _SNOW_TEMP_THRESHOLD_C
+
     # If we have freezing level and elevation, use that for better determination
-    if freezing_level_m is not None and elevation_m is not None:
+    if not (math.isnan(fl) or math.isnan(elev)):
         # If location is above freezing level, it's snow
-        # Add some buffer (300m) for mixed precipitation zone
-        if elevation_m > freezing_level_m + 300:
+        # Add some buffer for mixed precipitation zone
+        if elev > fl + _FREEZING_LEVEL_BUFFER_M:
             is_snow = True
-        elif elevation_m < freezing_level_m - 300:
+        elif elev < fl - _FREEZING_LEVEL_BUFFER_M:
             is_snow = False
         # Otherwise use temperature
-    
+
     if not is_snow:
         return 0.0, False
-    
+
     # Get temperature-based ratio
-    ratio = get_snow_ratio(temp_c)
-    
+    ratio = get_snow_ratio(temp)
+
     if ratio <= 0:
         return 0.0, False
-    
+
     # Calculate snowfall: precip_mm * ratio / 10 gives cm
     # (because 10mm water = 1cm at 10:1 ratio)
-    snowfall_cm = precip_mm * ratio / 10.0
-    
+    snowfall_cm = precip * ratio / _MM_TO_CM_DIVISOR
+
     return snowfall_cm, True
 
 
+def _snow_ratio_array(temp_c: np.ndarray) -> np.ndarray:
+    """Vectorized get_snow_ratio over an array of temperatures."""
+    # Segment i satisfies _RATIO_TEMPS[i] > temp >= _RATIO_TEMPS[i + 1]
+    i = np.searchsorted(-_RATIO_TEMPS, -temp_c, side="left") - 1
+    i = np.clip(i, 0, len(_RATIO_TEMPS) - 2)
+
+    t1 = _RATIO_TEMPS[i]
+    t2 = _RATIO_TEMPS[i + 1]
+    r1 = _RATIO_VALUES[i]
+    r2 = _RATIO_VALUES[i + 1]
+    ratio = r1 + (r2 - r1) * ((t1 - temp_c) / (t1 - t2))
+
+    ratio = np.where(temp_c >= _RATIO_TEMPS[0], _RATIO_VALUES[0], ratio)
+    return np.asarray(
+        np.where(temp_c <= _RATIO_TEMPS[-1], _RATIO_VALUES[-1], ratio), dtype=np.float64
+    )
+
+
+def _to_float_array(values: tuple[float | None, ...], n: int) -> np.ndarray:
+    """Convert optional values to a float array of length n, padding with NaN."""
+    out = np.full(n, np.nan)
+    m = min(n, len(values))
+    out[:m] = [np.nan if v is None else v for v in values[:m]]
+    return out
+
+
+def calculate_hourly_snowfall_arrays(
+    precip_values: tuple[float | None, ...],
+    temp_values: tuple[float | None, ...],
+    freezing_levels: tuple[float | None, ...] | None = None,
+    elevation_m: float | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate enhanced snowfall for hourly data series as NumPy arrays.
+
+    Vectorized equivalent of calculate_hourly_snowfall.
+
+    Args:
+        precip_values: Hourly precipitation in mm.
+        temp_values: Hourly temperature in Celsius.
+        freezing_levels: Optional hourly freezing level heights in meters.
+        elevation_m: Optional location elevation in meters.
+
+    Returns:
+        Tuple of float64 snowfall (cm), float64 rain (mm) and bool is_snow arrays.
+    """
+    n = len(precip_values)
+    precip = _to_float_array(precip_values, n)
+    temp = np.nan_to_num(_to_float_array(temp_values, n), nan=0.0)
+
+    has_precip = precip > 0  # False for missing (NaN) values
+    is_snow = temp <= _SNOW_TEMP_THRESHOLD_C
+
+    # If we have freezing level and elevation, use that for better determination
+    if freezing_levels and elevation_m is not None:
+        fl = _to_float_array(freezing_levels, n)
+        # Comparisons against NaN are False, so missing levels fall back to temperature
+        is_snow = np.where(elevation_m > fl + _FREEZING_LEVEL_BUFFER_M, True, is_snow)
+        is_snow = np.where(elevation_m < fl - _FREEZING_LEVEL_BUFFER_M, False, is_snow)
+
+    ratio = _snow_ratio_array(temp)
+    is_snow &= has_precip & (ratio > 0)
+
+    snowfall_cm = np.where(is_snow, precip * ratio / _MM_TO_CM_DIVISOR, 0.0)
+    rain_mm = np.where(has_precip & ~is_snow, precip, 0.0)
+
+    return snowfall_cm, rain_mm, is_snow
+
+
 def calculate_hourly_snowfall(
     precip_values: tuple[float | None, ...],
     temp_values: tuple[float | None, ...],
@@ -127,45 +233,23 @@ def calculate_hourly_snowfall(
     elevation_m: float | None = None,
 ) -> tuple[tuple[float, ...], tuple[float, ...], tuple[bool, ...]]:
     """Calculate enhanced snowfall for hourly data series.
-    
+
+    Tuple-returning wrapper around calculate_hourly_snowfall_arrays.
+
     Args:
         precip_values: Hourly precipitation in mm.
         temp_values: Hourly temperature in Celsius.
         freezing_levels: Optional hourly freezing level heights in meters.
         elevation_m: Optional location elevation in meters.
-        
+
     Returns:
         Tuple of:
         - snowfall_cm: Enhanced snowfall values in cm
         - rain_mm: Rain values in mm (precipitation that doesn't fall as snow)
         - is_snow: Boolean indicating if each hour has snow
     """
-    snowfall_cm: list[float] = []
-    rain_mm: list[float] = []
-    is_snow_flags: list[bool] = []
-    
-    for i, precip in enumerate(precip_values):
-        temp = temp_values[i] if i < len(temp_values) else None
-        freezing_level = None
-        if freezing_levels and i < len(freezing_levels):
-            freezing_level = freezing_levels[i]
-        
-        if precip is None or precip <= 0:
-            snowfall_cm.append(0.0)
-            rain_mm.append(0.0)
-            is_snow_flags.append(False)
-            continue
-        
-        snow, is_snow = calculate_snowfall_from_precip(
-            precip_mm=precip,
-            temp_c=temp if temp is not None else 0.0,
-            freezing_level_m=freezing_level,
-            elevation_m=elevation_m,
-        )
-        
-        snowfall_cm.append(snow)
-        rain_mm.append(0.0 if is_snow else precip)
-        is_snow_flags.append(is_snow)
-    
-    return tuple(snowfall_cm), tuple(rain_mm), tuple(is_snow_flags)
+    snowfall_cm, rain_mm, is_snow = calculate_hourly_snowfall_arrays(
+        precip_values, temp_values, freezing_levels, elevation_m
+    )
 
+    return tuple(snowfall_cm.tolist()), tuple(rain_mm.tolist()), tuple(is_snow.tolist())
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from datetime import datetime, timedelta, timezone
-from typing import Union
+from functools import lru_cache
+from typing import Final, Union
+
+import numpy as np
 
 from weather.domain.errors import RangeError
 
 
 TimeOffset = Union[datetime, timedelta]
 
+_EPOCH: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+
 
 def ensure_utc(dt: datetime) -> datetime:
     """Ensure a datetime is in UTC timezone.
@@ -26,6 +33,13 @@ def ensure_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         raise ValueError("Datetime must have timezone info. Use timezone-aware datetimes.")
 
+    # Fast path: already UTC, skip the tzinfo conversion
+    if dt.tzinfo is timezone.utc:
+        return dt
+
+    if dt.utcoffset() == timedelta(0):
+        return dt.replace(tzinfo=timezone.utc)
+
     return dt.astimezone(timezone.utc)
 
 
@@ -45,12 +59,37 @@ def infer_model_run_time(times_utc: list[datetime]) -> datetime | None:
         return None
 
     first_time = times_utc[0]
+    if first_time.tzinfo is not None:
+        # Equal instants in other zones hash alike, so key the cache on UTC
+        first_time = ensure_utc(first_time)
+
+    return _infer_model_run_time_from_first(first_time)
+
+
+@lru_cache(maxsize=1024)
+def _infer_model_run_time_from_first(first_time: datetime) -> datetime:
+    """Infer the model run time from the first forecast timestamp.
+
+    Cached on the timestamp, since every forecast from the same run
+    shares its first time. Callers pass UTC (or naive) datetimes.
+
+    Args:
+        first_time: The first forecast timestamp.
 
+    Returns:
+        The inferred model run time.
+    """
     # Model runs are typically at 00, 06, 12, or 18 UTC
     # Round down to the nearest 6-hour interval
     run_hour = (first_time.hour // 6) * 6
 
-    return first_time.replace(hour=run_hour, minute=0, second=0, microsecond=0)
+    return datetime(
+        first_time.year,
+        first_time.month,
+        first_time.day,
+        run_hour,
+        tzinfo=first_time.tzinfo,
+    )
 
 
 def resolve_time_offset(
@@ -73,10 +112,38 @@ def resolve_time_offset(
         return ensure_utc(offset)
 
 
+def _epoch_us(dt: datetime) -> int:
+    """Microseconds since the Unix epoch for a timezone-aware datetime (exact)."""
+    return (dt - _EPOCH) // _ONE_MICROSECOND
+
+
+def times_to_epoch(times_utc: list[datetime]) -> np.ndarray:
+    """Convert forecast timestamps to Unix microseconds.
+
+    The result can be computed once per forecast and passed to
+    get_time_index / slice_time_range so lookups compare integers
+    instead of datetime objects. Microsecond resolution is exact for
+    datetimes, so the integer lookups order times the same way the
+    datetime comparisons do.
+
+    Args:
+        times_utc: List of timezone-aware forecast timestamps.
+
+    Returns:
+        An int64 array of Unix timestamps in microseconds.
+    """
+    return np.fromiter(
+        (_epoch_us(t) for t in times_utc),
+        dtype=np.int64,
+        count=len(times_utc),
+    )
+
+
 def get_time_index(
     target: datetime,
     times_utc: list[datetime],
     clamp: bool = True,
+    times_epoch: np.ndarray | None = None,
 ) -> int:
     """Find the index of a target time in the forecast times.
 
@@ -84,6 +151,8 @@ def get_time_index(
         target: The target datetime to find.
         times_utc: List of forecast timestamps.
         clamp: If True, clamp to valid range. If False, raise on out of bounds.
+        times_epoch: Optional precomputed times_to_epoch(times_utc). When
+            given, the lookup is done with np.searchsorted.
 
     Returns:
         The index of the closest time at or before target.
@@ -110,18 +179,20 @@ def get_time_index(
             f"Target time {target_utc} is after forecast end {times_utc[-1]}"
         )
 
-    # Binary search for the correct index
-    for i, t in enumerate(times_utc):
-        if t > target_utc:
-            return max(0, i - 1)
+    # Binary search for the last time at or before target
+    if times_epoch is not None:
+        target_epoch = _epoch_us(target_utc)
+        idx = int(np.searchsorted(times_epoch, target_epoch, side="right")) - 1
+        return max(0, idx)
 
-    return len(times_utc) - 1
+    return max(0, bisect_right(times_utc, target_utc) - 1)
 
 
 def slice_time_range(
     start: TimeOffset,
     end: TimeOffset,
     times_utc: list[datetime],
+    times_epoch: np.ndarray | None = None,
 ) -> tuple[int, int]:
     """Get the index range for a time window.
 
@@ -129,6 +200,7 @@ def slice_time_range(
         start: Start of range (datetime or timedelta from first time).
         end: End of range (datetime or timedelta from first time).
         times_utc: List of forecast timestamps.
+        times_epoch: Optional precomputed times_to_epoch(times_utc).
 
     Returns:
         Tuple of (start_index, end_index) for range [start, end).
@@ -148,8 +220,14 @@ def slice_time_range(
     if end_dt <= start_dt:
         raise RangeError(f"End time must be after start time: {start_dt} >= {end_dt}")
 
-    start_idx = get_time_index(start_dt, times_utc, clamp=True)
-    end_idx = get_time_index(end_dt, times_utc, clamp=True)
+    if times_epoch is not None:
+        # Both clamped lookups in a single binary search
+        targets = [_epoch_us(start_dt), _epoch_us(end_dt)]
+        indices = np.searchsorted(times_epoch, targets, side="right") - 1
+        start_idx, end_idx = indices.clip(0, len(times_utc) - 1).tolist()
+    else:
+        start_idx = get_time_index(start_dt, times_utc, clamp=True)
+        end_idx = get_time_index(end_dt, times_utc, clamp=True)
 
     # Adjust end_idx for exclusive end semantics [start, end)
     # If end_dt is after the timestamp at end_idx, include that timestamp
@@ -163,6 +241,21 @@ def slice_time_range(
     return start_idx, min(end_idx, len(times_utc))
 
 
+def _format_duration(hours: int) -> str:
+    """Format a duration in hours without the lookup table."""
+    if hours < 24:
+        return f"{hours}h"
+
+    days, remaining_hours = divmod(hours, 24)
+    if not remaining_hours:
+        return f"{days}d"
+    return f"{days}d {remaining_hours}h"
+
+
+# Preformatted durations for 0-720 hours (30 days), covering every forecast length
+_DURATION_STRINGS: Final[tuple[str, ...]] = tuple(map(_format_duration, range(721)))
+
+
 def format_duration(hours: int) -> str:
     """Format a duration in hours as a human-readable string.
 
@@ -172,14 +265,6 @@ def format_duration(hours: int) -> str:
     Returns:
         Formatted string like "24h", "3d", "7d 12h".
     """
-    if hours < 24:
-        return f"{hours}h"
-
-    days = hours // 24
-    remaining_hours = hours % 24
-
-    if remaining_hours == 0:
-        return f"{days}d"
-
-    return f"{days}d {remaining_hours}h"
-
+    if type(hours) is int and 0 <= hours < len(_DURATION_STRINGS):
+        return _DURATION_STRINGS[hours]
+    return _format_duration(hours)
@@ -0,0 +1,54 @@
+"""Shared fixtures for the weather test suite."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from weather.domain.forecast import Forecast
+
+CANONICAL_START = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _canonical_forecast(hours: int) -> Forecast:
+    """Build the canonical six-variable hourly forecast (already UTC)."""
+    return Forecast._trusted(
+        lat=43.48,
+        lon=-110.76,
+        api_lat=43.5,
+        api_lon=-110.75,
+        elevation_m=3000.0,
+        model_id="gfs",
+        model_run_utc=CANONICAL_START,
+        times_utc=[CANONICAL_START + timedelta(hours=h) for h in range(hours)],
+        hourly_data={
+            "temperature_2m": tuple(map(float, range(-10, hours - 10))),
+            "wind_speed_10m": tuple(map(float, range(20, hours + 20))),
+            "wind_gusts_10m": tuple(map(float, range(30, hours + 30))),
+            "snowfall": (0.5,) * hours,
+            "precipitation": (1.0,) * hours,
+            "freezing_level_height": tuple(map(float, range(2000, 2000 + hours * 10, 10))),
+        },
+        hourly_units={
+            "temperature_2m": "C",
+            "wind_speed_10m": "kmh",
+            "wind_gusts_10m": "kmh",
+            "snowfall": "cm",
+            "precipitation": "mm",
+            "freezing_level_height": "m",
+        },
+    )
+
+
+@pytest.fixture(scope="session")
+def canonical_forecast_24h() -> Forecast:
+    """Canonical 24-hour UTC forecast shared by the whole session.
+
+    Tests must not mutate it; copy with dataclasses.replace first.
+    """
+    return _canonical_forecast(24)
+
+
+@pytest.fixture(scope="session")
+def canonical_forecast_dict_3h() -> dict:
+    """to_dict() output of a 3-hour canonical forecast, computed once."""
+    return _canonical_forecast(3).to_dict()
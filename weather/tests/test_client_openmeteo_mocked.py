@@ -1,10 +1,13 @@
 """Tests for MeteoClient with mocked HTTP responses."""
 
+import numpy as np
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
 from weather.clients.openmeteo import MeteoClient
+from weather.config.models import get_model_config
 from weather.domain.forecast import Forecast
 from weather.domain.errors import ApiError, ModelError
 
@@ -40,20 +43,19 @@ class MockHourly:
     """Mock hourly data from Open-Meteo."""
 
     def __init__(self):
-        import numpy as np
-
         self._time_start = int(datetime(2024, 1, 15, 0, tzinfo=timezone.utc).timestamp())
         self._time_end = int(datetime(2024, 1, 16, 0, tzinfo=timezone.utc).timestamp())
         self._interval = 3600  # 1 hour
 
         # Sample data for each variable
+        t = np.arange(24, dtype=np.float64)
         self._variables = {
-            0: ("temperature_2m", np.array([-5.0 + i * 0.5 for i in range(24)]), 1),
-            1: ("wind_speed_10m", np.array([20.0 + i for i in range(24)]), 8),
-            2: ("wind_gusts_10m", np.array([35.0 + i for i in range(24)]), 8),
-            3: ("snowfall", np.array([0.5 for _ in range(24)]), 4),
-            4: ("precipitation", np.array([1.0 for _ in range(24)]), 3),
-            5: ("freezing_level_height", np.array([2000.0 + i * 10 for i in range(24)]), 5),
+            0: ("temperature_2m", -5.0 + 0.5 * t, 1),
+            1: ("wind_speed_10m", 20.0 + t, 8),
+            2: ("wind_gusts_10m", 35.0 + t, 8),
+            3: ("snowfall", np.full(24, 0.5), 4),
+            4: ("precipitation", np.full(24, 1.0), 3),
+            5: ("freezing_level_height", 2000.0 + 10.0 * t, 5),
         }
 
     def Time(self) -> int:
@@ -86,6 +88,19 @@ class MockVariable:
         return self._unit
 
 
+@pytest.fixture
+def client(monkeypatch) -> MeteoClient:
+    """MeteoClient with session setup (HTTP cache, retries) stubbed out."""
+    monkeypatch.setattr(MeteoClient, "_setup_session", lambda self: None)
+    return MeteoClient()
+
+
+@pytest.fixture(scope="module")
+def mock_response() -> MockOpenMeteoResponse:
+    """Shared read-only Open-Meteo response."""
+    return MockOpenMeteoResponse()
+
+
 class TestMeteoClientInit:
     """Tests for MeteoClient initialization."""
 
@@ -120,14 +135,10 @@ class TestMeteoClientInit:
 class TestGetForecast:
     """Tests for get_forecast method with mocked responses."""
 
-    @patch.object(MeteoClient, "_setup_session")
-    def test_get_forecast_success(self, mock_setup):
+    def test_get_forecast_success(self, client, mock_response):
         """Test successful forecast retrieval."""
-        client = MeteoClient()
-
         # Mock the client's weather_api method
-        mock_response = MockOpenMeteoResponse()
-        client._client = Mock()
+        client._client = Mock(spec=["weather_api"])
         client._client.weather_api.return_value = [mock_response]
 
         forecast = client.get_forecast(43.48, -110.76, model="gfs")
@@ -139,13 +150,9 @@ class TestGetForecast:
         assert forecast.api_lon == -110.75
         assert forecast.model_id == "gfs"
 
-    @patch.object(MeteoClient, "_setup_session")
-    def test_get_forecast_with_elevation(self, mock_setup):
+    def test_get_forecast_with_elevation(self, client, mock_response):
         """Test forecast with elevation override."""
-        client = MeteoClient()
-
-        mock_response = MockOpenMeteoResponse()
-        client._client = Mock()
+        client._client = Mock(spec=["weather_api"])
         client._client.weather_api.return_value = [mock_response]
 
         forecast = client.get_forecast(
@@ -157,33 +164,26 @@ class TestGetForecast:
 
         assert forecast.elevation_m == 3200
 
-    @patch.object(MeteoClient, "_setup_session")
-    def test_get_forecast_invalid_model(self, mock_setup):
+    def test_get_forecast_invalid_model(self, client):
         """Test that invalid model raises ModelError."""
-        client = MeteoClient()
-
         with pytest.raises(ModelError):
             client.get_forecast(43.48, -110.76, model="invalid_model")
 
-    @patch.object(MeteoClient, "_setup_session")
-    def test_get_forecast_api_error(self, mock_setup):
+    def test_get_forecast_api_error(self, client):
         """Test that API errors are properly raised."""
-        client = MeteoClient()
+        def weather_api(*args, **kwargs):
+            raise Exception("Connection failed")
 
-        client._client = Mock()
-        client._client.weather_api.side_effect = Exception("Connection failed")
+        client._client = SimpleNamespace(weather_api=weather_api)
 
         with pytest.raises(ApiError) as exc_info:
             client.get_forecast(43.48, -110.76)
 
         assert "Connection failed" in str(exc_info.value)
 
-    @patch.object(MeteoClient, "_setup_session")
-    def test_get_forecast_empty_response(self, mock_setup):
+    def test_get_forecast_empty_response(self, client):
         """Test that empty response raises ApiError."""
-        client = MeteoClient()
-
-        client._client = Mock()
+        client._client = Mock(spec=["weather_api"])
         client._client.weather_api.return_value = []
 
         with pytest.raises(ApiError) as exc_info:
@@ -195,65 +195,29 @@ class TestGetForecast:
 class TestModelSelection:
     """Tests for model selection and validation."""
 
-    @patch.object(MeteoClient, "_setup_session")
-    def test_gfs_model(self, mock_setup):
-        """Test GFS model selection."""
-        client = MeteoClient()
-
-        mock_response = MockOpenMeteoResponse()
-        client._client = Mock()
+    @pytest.mark.parametrize(
+        "model,expected_id",
+        [
+            ("gfs", "gfs"),
+            ("ifs", "ifs"),
+            ("aifs", "aifs"),
+            ("ecmwf", "ifs"),  # "ecmwf" is an alias for "ifs"
+        ],
+    )
+    def test_model_selection(self, client, mock_response, model, expected_id):
+        """Test model selection, including aliases."""
+        client._client = Mock(spec=["weather_api"])
         client._client.weather_api.return_value = [mock_response]
 
-        forecast = client.get_forecast(43.48, -110.76, model="gfs")
-        assert forecast.model_id == "gfs"
-
-    @patch.object(MeteoClient, "_setup_session")
-    def test_ifs_model(self, mock_setup):
-        """Test IFS model selection."""
-        client = MeteoClient()
-
-        mock_response = MockOpenMeteoResponse()
-        client._client = Mock()
-        client._client.weather_api.return_value = [mock_response]
-
-        forecast = client.get_forecast(43.48, -110.76, model="ifs")
-        assert forecast.model_id == "ifs"
-
-    @patch.object(MeteoClient, "_setup_session")
-    def test_aifs_model(self, mock_setup):
-        """Test AIFS model selection."""
-        client = MeteoClient()
-
-        mock_response = MockOpenMeteoResponse()
-        client._client = Mock()
-        client._client.weather_api.return_value = [mock_response]
-
-        forecast = client.get_forecast(43.48, -110.76, model="aifs")
-        assert forecast.model_id == "aifs"
-
-    @patch.object(MeteoClient, "_setup_session")
-    def test_model_alias(self, mock_setup):
-        """Test model aliases work."""
-        client = MeteoClient()
-
-        mock_response = MockOpenMeteoResponse()
-        client._client = Mock()
-        client._client.weather_api.return_value = [mock_response]
-
-        # "ecmwf" is an alias for "ifs"
-        forecast = client.get_forecast(43.48, -110.76, model="ecmwf")
-        assert forecast.model_id == "ifs"
+        forecast = client.get_forecast(43.48, -110.76, model=model)
+        assert forecast.model_id == expected_id
 
 
 class TestBuildParams:
     """Tests for _build_params method."""
 
-    @patch.object(MeteoClient, "_setup_session")
-    def test_basic_params(self, mock_setup):
+    def test_basic_params(self, client):
         """Test basic parameter building."""
-        from weather.config.models import get_model_config
-
-        client = MeteoClient()
         model_config = get_model_config("gfs")
 
         params = client._build_params(
@@ -272,12 +236,8 @@ class TestBuildParams:
         assert params["timezone"] == "UTC"
         assert "hourly" in params
 
-    @patch.object(MeteoClient, "_setup_session")
-    def test_elevation_param(self, mock_setup):
+    def test_elevation_param(self, client):
         """Test elevation parameter is included when specified."""
-        from weather.config.models import get_model_config
-
-        client = MeteoClient()
         model_config = get_model_config("gfs")
 
         params = client._build_params(
@@ -292,12 +252,8 @@ class TestBuildParams:
 
         assert params["elevation"] == 3200
 
-    @patch.object(MeteoClient, "_setup_session")
-    def test_unit_preferences(self, mock_setup):
+    def test_unit_preferences(self, client):
         """Test unit preferences are included."""
-        from weather.config.models import get_model_config
-
-        client = MeteoClient()
         model_config = get_model_config("gfs")
 
         params = client._build_params(
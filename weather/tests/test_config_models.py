@@ -11,30 +11,54 @@ from weather.config.models import (
 )
 from weather.domain.errors import ModelError
 
+pytestmark = pytest.mark.fast
+
+_MODEL_IDS = tuple(MODELS)
+
 
 class TestModelConfig:
     """Tests for ModelConfig dataclass."""
 
-    def test_model_config_creation(self):
+    @pytest.fixture
+    def make_config(self):
+        """Factory for ModelConfig with test defaults."""
+        def _make(**overrides):
+            kwargs = {
+                "model_id": "test",
+                "api_model": "test_model",
+                "display_name": "Test Model",
+                "provider": "Test Provider",
+                "max_forecast_days": 10,
+                "resolution_degrees": 0.25,
+                "description": "A test model",
+            }
+            kwargs.update(overrides)
+            return ModelConfig(**kwargs)
+
+        return _make
+
+    def test_model_config_creation(self, make_config):
         """Test creating a ModelConfig."""
-        config = ModelConfig(
-            model_id="test",
-            api_model="test_model",
-            display_name="Test Model",
-            provider="Test Provider",
-            max_forecast_days=10,
-            resolution_degrees=0.25,
-            description="A test model",
+        config = make_config()
+
+        assert (
+            config.model_id,
+            config.api_model,
+            config.display_name,
+            config.provider,
+            config.max_forecast_days,
+            config.resolution_degrees,
+            config.description,
+        ) == (
+            "test",
+            "test_model",
+            "Test Model",
+            "Test Provider",
+            10,
+            0.25,
+            "A test model",
         )
 
-        assert config.model_id == "test"
-        assert config.api_model == "test_model"
-        assert config.display_name == "Test Model"
-        assert config.provider == "Test Provider"
-        assert config.max_forecast_days == 10
-        assert config.resolution_degrees == 0.25
-        assert config.description == "A test model"
-
     def test_model_config_immutable(self):
         """Test that ModelConfig is immutable (frozen)."""
         config = MODELS["gfs"]
@@ -42,79 +66,59 @@ class TestModelConfig:
         with pytest.raises(AttributeError):
             config.model_id = "modified"
 
-    def test_model_config_equality(self):
+    def test_model_config_equality(self, make_config):
         """Test ModelConfig equality."""
-        config1 = ModelConfig(
-            model_id="test",
-            api_model="test_api",
-            display_name="Test",
-            provider="Provider",
-            max_forecast_days=7,
-            resolution_degrees=0.25,
-            description="Desc",
-        )
-        config2 = ModelConfig(
-            model_id="test",
-            api_model="test_api",
-            display_name="Test",
-            provider="Provider",
-            max_forecast_days=7,
-            resolution_degrees=0.25,
-            description="Desc",
-        )
+        assert make_config() == make_config()
 
-        assert config1 == config2
+    @pytest.mark.parametrize(
+        "overrides",
+        [{"model_id": "other"}, {"max_forecast_days": 7}, {"resolution_degrees": 0.1}],
+    )
+    def test_model_config_inequality(self, make_config, overrides):
+        """Test that configs differing in one field are not equal."""
+        assert make_config() != make_config(**overrides)
 
 
 class TestModelsRegistry:
     """Tests for the MODELS registry."""
 
-    def test_gfs_model_exists(self):
-        """Test that GFS model is registered."""
-        assert "gfs" in MODELS
-        config = MODELS["gfs"]
-        assert config.model_id == "gfs"
-        assert config.provider == "NOAA"
-        assert config.api_model == "gfs_seamless"
-
-    def test_ifs_model_exists(self):
-        """Test that IFS model is registered."""
-        assert "ifs" in MODELS
-        config = MODELS["ifs"]
-        assert config.model_id == "ifs"
-        assert config.provider == "ECMWF"
-
-    def test_aifs_model_exists(self):
-        """Test that AIFS model is registered."""
-        assert "aifs" in MODELS
-        config = MODELS["aifs"]
-        assert config.model_id == "aifs"
-        assert config.provider == "ECMWF"
-
-    def test_icon_model_exists(self):
-        """Test that ICON model is registered."""
-        assert "icon" in MODELS
-        config = MODELS["icon"]
-        assert config.model_id == "icon"
-        assert config.provider == "DWD"
-
-    def test_jma_model_exists(self):
-        """Test that JMA model is registered."""
-        assert "jma" in MODELS
-        config = MODELS["jma"]
-        assert config.model_id == "jma"
-        assert config.provider == "JMA"
-
-    def test_all_models_have_required_fields(self):
-        """Test that all models have required fields populated."""
-        for model_id, config in MODELS.items():
-            assert config.model_id == model_id
-            assert config.api_model, f"{model_id} missing api_model"
-            assert config.display_name, f"{model_id} missing display_name"
-            assert config.provider, f"{model_id} missing provider"
-            assert config.max_forecast_days > 0, f"{model_id} invalid max_forecast_days"
-            assert config.resolution_degrees > 0, f"{model_id} invalid resolution"
-            assert config.description, f"{model_id} missing description"
+    @pytest.fixture(scope="module")
+    def models_snapshot(self):
+        """(model_id, provider, api_model) for every registered model."""
+        return {
+            mid: (c.model_id, c.provider, c.api_model) for mid, c in MODELS.items()
+        }
+
+    @pytest.mark.parametrize(
+        "mid,expected",
+        [
+            ("gfs", ("gfs", "NOAA", "gfs_seamless")),
+            ("ifs", ("ifs", "ECMWF", "ecmwf_ifs025")),
+            ("aifs", ("aifs", "ECMWF", "ecmwf_aifs025_single")),
+            ("icon", ("icon", "DWD", "icon_seamless")),
+            ("jma", ("jma", "JMA", "jma_seamless")),
+        ],
+    )
+    def test_model_registered(self, models_snapshot, mid, expected):
+        """Test that each model is registered with the expected fields."""
+        assert models_snapshot[mid] == expected
+
+    def test_registry_is_read_only(self):
+        """Test that the MODELS registry cannot be modified."""
+        with pytest.raises(TypeError):
+            MODELS["new"] = MODELS["gfs"]
+
+    @pytest.mark.parametrize("model_id", _MODEL_IDS)
+    def test_model_has_required_fields(self, model_id):
+        """Test that each model has required fields populated."""
+        config = MODELS[model_id]
+        assert config.model_id == model_id
+        assert config.api_model, f"{model_id} missing api_model"
+        assert config.display_name, f"{model_id} missing display_name"
+        assert config.provider, f"{model_id} missing provider"
+        assert config.max_forecast_days > 0, f"{model_id} invalid max_forecast_days"
+        assert config.resolution_degrees > 0, f"{model_id} invalid resolution"
+        assert config.description, f"{model_id} missing description"
 
 
 class TestModelAliases:
@@ -134,45 +138,42 @@ class TestModelAliases:
 
     def test_all_aliases_point_to_valid_models(self):
         """Test that all aliases point to valid models."""
-        for alias, model_id in MODEL_ALIASES.items():
-            assert model_id in MODELS, f"Alias '{alias}' points to unknown model '{model_id}'"
+        assert set(MODEL_ALIASES.values()) <= MODELS.keys()
 
 
 class TestValidateModelId:
     """Tests for validate_model_id function."""
 
-    def test_valid_model_id(self):
-        """Test validation of valid model IDs."""
-        assert validate_model_id("gfs") == "gfs"
-        assert validate_model_id("ifs") == "ifs"
-        assert validate_model_id("aifs") == "aifs"
-        assert validate_model_id("icon") == "icon"
-        assert validate_model_id("jma") == "jma"
-
-    def test_case_insensitive(self):
-        """Test that validation is case-insensitive."""
-        assert validate_model_id("GFS") == "gfs"
-        assert validate_model_id("IFS") == "ifs"
-        assert validate_model_id("AIFS") == "aifs"
-
-    def test_strips_whitespace(self):
-        """Test that whitespace is stripped."""
-        assert validate_model_id("  gfs  ") == "gfs"
-        assert validate_model_id("\tifs\n") == "ifs"
-
-    def test_alias_returns_canonical(self):
-        """Test that aliases return canonical model ID."""
-        assert validate_model_id("noaa") == "gfs"
-        assert validate_model_id("ecmwf") == "ifs"
-        assert validate_model_id("european") == "ifs"
-        assert validate_model_id("ai") == "aifs"
-        assert validate_model_id("german") == "icon"
-        assert validate_model_id("dwd") == "icon"
-
-    def test_alias_case_insensitive(self):
-        """Test that aliases are case-insensitive."""
-        assert validate_model_id("NOAA") == "gfs"
-        assert validate_model_id("ECMWF") == "ifs"
+    @pytest.mark.parametrize(
+        "model_id,expected",
+        [
+            # Canonical IDs
+            ("gfs", "gfs"),
+            ("ifs", "ifs"),
+            ("aifs", "aifs"),
+            ("icon", "icon"),
+            ("jma", "jma"),
+            # Case-insensitive
+            ("GFS", "gfs"),
+            ("IFS", "ifs"),
+            ("AIFS", "aifs"),
+            # Whitespace stripped
+            ("  gfs  ", "gfs"),
+            ("\tifs\n", "ifs"),
+            # Aliases return canonical ID
+            ("noaa", "gfs"),
+            ("ecmwf", "ifs"),
+            ("european", "ifs"),
+            ("ai", "aifs"),
+            ("german", "icon"),
+            ("dwd", "icon"),
+            ("NOAA", "gfs"),
+            ("ECMWF", "ifs"),
+        ],
+    )
+    def test_validate_model_id(self, model_id, expected):
+        """Test that IDs, aliases and case/whitespace variants resolve to the canonical ID."""
+        assert validate_model_id(model_id) == expected
 
     def test_invalid_model_raises_modelerror(self):
         """Test that invalid model ID raises ModelError."""
@@ -235,9 +236,7 @@ class TestListAvailableModels:
 
     def test_returns_model_configs(self):
         """Test that list contains ModelConfig objects."""
-        models = list_available_models()
-        for model in models:
-            assert isinstance(model, ModelConfig)
+        assert all(isinstance(m, ModelConfig) for m in list_available_models())
 
     def test_returns_all_models(self):
         """Test that all registered models are returned."""
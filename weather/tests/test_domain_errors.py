@@ -9,6 +9,8 @@ from weather.domain.errors import (
     RangeError,
 )
 
+pytestmark = pytest.mark.fast
+
 
 class TestWeatherError:
     """Tests for base WeatherError class."""
@@ -67,17 +69,6 @@ class TestApiError:
         assert "Not found" in result
         assert "(status=404)" in result
 
-    def test_inherits_from_weather_error(self):
-        """Test that ApiError inherits from WeatherError."""
-        error = ApiError("test")
-        assert isinstance(error, WeatherError)
-        assert isinstance(error, Exception)
-
-    def test_can_catch_as_weather_error(self):
-        """Test that ApiError can be caught as WeatherError."""
-        with pytest.raises(WeatherError):
-            raise ApiError("test")
-
 
 class TestUnitError:
     """Tests for UnitError class."""
@@ -94,11 +85,6 @@ class TestUnitError:
         assert error.unit == "xyz"
         assert "Invalid unit" in str(error)
 
-    def test_inherits_from_weather_error(self):
-        """Test that UnitError inherits from WeatherError."""
-        error = UnitError("test")
-        assert isinstance(error, WeatherError)
-
     def test_unit_attribute_accessible(self):
         """Test that unit attribute is accessible."""
         error = UnitError("Bad unit", unit="invalid")
@@ -124,11 +110,6 @@ class TestModelError:
         assert error.model_id == "fake"
         assert "Invalid model" in str(error)
 
-    def test_inherits_from_weather_error(self):
-        """Test that ModelError inherits from WeatherError."""
-        error = ModelError("test")
-        assert isinstance(error, WeatherError)
-
     def test_model_id_attribute_accessible(self):
         """Test that model_id attribute is accessible."""
         error = ModelError("Bad model", model_id="invalid_model")
@@ -147,37 +128,26 @@ class TestRangeError:
         error = RangeError("Time range out of bounds")
         assert str(error) == "Time range out of bounds"
 
-    def test_inherits_from_weather_error(self):
-        """Test that RangeError inherits from WeatherError."""
-        error = RangeError("test")
-        assert isinstance(error, WeatherError)
-
     def test_can_be_raised(self):
         """Test that RangeError can be raised and caught."""
         with pytest.raises(RangeError):
             raise RangeError("Range invalid")
 
-    def test_can_catch_as_weather_error(self):
-        """Test that RangeError can be caught as WeatherError."""
-        with pytest.raises(WeatherError):
-            raise RangeError("test")
-
 
 class TestExceptionHierarchy:
     """Tests for exception hierarchy and catching behavior."""
 
-    def test_all_errors_catchable_as_weather_error(self):
-        """Test that all error types are catchable as WeatherError."""
-        errors = [
-            ApiError("api"),
-            UnitError("unit"),
-            ModelError("model"),
-            RangeError("range"),
-        ]
-
-        for error in errors:
-            with pytest.raises(WeatherError):
-                raise error
+    @pytest.mark.parametrize("cls", [ApiError, UnitError, ModelError, RangeError])
+    def test_subclass_of_weather_error(self, cls):
+        """Test that each error type is a WeatherError subclass."""
+        assert issubclass(cls, WeatherError)
+        assert issubclass(cls, Exception)
+
+    @pytest.mark.parametrize("cls", [ApiError, UnitError, ModelError, RangeError])
+    def test_can_catch_as_weather_error(self, cls):
+        """Test that each error type is catchable as WeatherError."""
+        with pytest.raises(WeatherError):
+            raise cls("test")
 
     def test_specific_catch_over_general(self):
         """Test that specific exceptions can be caught specifically."""
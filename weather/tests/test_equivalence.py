@@ -1,10 +1,18 @@
 """Tests for forecast equivalence."""
 
+import dataclasses
+
 import pytest
 from datetime import datetime, timezone
 
 from weather.domain.forecast import Forecast
 
+pytestmark = pytest.mark.fast
+
+_BASE_RUN = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+_BASE_HOURLY = {"temperature_2m": (0.0,)}
+_BASE_UNITS = {"temperature_2m": "C"}
+
 
 def create_forecast(
     lat: float = 43.48,
@@ -16,7 +24,7 @@ def create_forecast(
 ) -> Forecast:
     """Create a minimal forecast for equivalence testing."""
     if model_run_utc is None:
-        model_run_utc = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+        model_run_utc = _BASE_RUN
 
     return Forecast(
         lat=lat,
@@ -27,95 +35,86 @@ def create_forecast(
         model_id=model_id,
         model_run_utc=model_run_utc,
         times_utc=[model_run_utc],
-        hourly_data={"temperature_2m": (0.0,)},
-        hourly_units={"temperature_2m": "C"},
+        hourly_data=_BASE_HOURLY,
+        hourly_units=_BASE_UNITS,
     )
 
 
+@pytest.fixture(scope="module")
+def baseline() -> Forecast:
+    """Shared default forecast; derive variants with dataclasses.replace."""
+    return create_forecast()
+
+
 class TestIsEquivalent:
     """Tests for Forecast.is_equivalent method."""
 
-    def test_same_forecast_is_equivalent(self):
+    def test_same_forecast_is_equivalent(self, baseline):
         """Test that a forecast is equivalent to itself."""
-        forecast = create_forecast()
-        assert forecast.is_equivalent(forecast)
+        assert baseline.is_equivalent(baseline)
 
-    def test_identical_forecasts_are_equivalent(self):
+    def test_identical_forecasts_are_equivalent(self, baseline):
         """Test that two identical forecasts are equivalent."""
-        forecast1 = create_forecast()
-        forecast2 = create_forecast()
-        assert forecast1.is_equivalent(forecast2)
+        assert baseline.is_equivalent(dataclasses.replace(baseline))
 
-    def test_different_model_not_equivalent(self):
+    def test_different_model_not_equivalent(self, baseline):
         """Test that different models are not equivalent."""
-        forecast1 = create_forecast(model_id="gfs")
-        forecast2 = create_forecast(model_id="ifs")
-        assert not forecast1.is_equivalent(forecast2)
+        other = dataclasses.replace(baseline, model_id="ifs")
+        assert not baseline.is_equivalent(other)
 
     def test_different_model_run_not_equivalent(self):
         """Test that different model runs are not equivalent."""
-        run1 = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
         run2 = datetime(2024, 1, 15, 6, 0, 0, tzinfo=timezone.utc)
 
-        forecast1 = create_forecast(model_run_utc=run1)
+        forecast1 = create_forecast(model_run_utc=_BASE_RUN)
         forecast2 = create_forecast(model_run_utc=run2)
         assert not forecast1.is_equivalent(forecast2)
 
-    def test_close_locations_are_equivalent(self):
-        """Test that locations within 100m are equivalent."""
-        # Two points about 50 meters apart (same grid point)
-        forecast1 = create_forecast(api_lat=43.5000, api_lon=-110.75)
-        forecast2 = create_forecast(api_lat=43.5003, api_lon=-110.75)
-        assert forecast1.is_equivalent(forecast2)
-
-    def test_distant_locations_not_equivalent(self):
-        """Test that locations more than 100m apart are not equivalent."""
-        # Two points about 1km apart
-        forecast1 = create_forecast(api_lat=43.5, api_lon=-110.75)
-        forecast2 = create_forecast(api_lat=43.51, api_lon=-110.75)
-        assert not forecast1.is_equivalent(forecast2)
-
-    def test_custom_threshold(self):
-        """Test equivalence with custom distance threshold."""
-        # Two points about 1km apart
-        forecast1 = create_forecast(api_lat=43.5, api_lon=-110.75)
-        forecast2 = create_forecast(api_lat=43.51, api_lon=-110.75)
-
-        # Should not be equivalent at default 100m
-        assert not forecast1.is_equivalent(forecast2)
+    @pytest.mark.parametrize(
+        "api_lat1,api_lat2,threshold,expect_equivalent",
+        [
+            # Two points about 30 meters apart (same grid point)
+            (43.5000, 43.5003, None, True),
+            # Two points about 1km apart
+            (43.5, 43.51, None, False),
+            # Same 1km pair with a 2000m threshold
+            (43.5, 43.51, 2000, True),
+        ],
+    )
+    def test_equivalence_by_distance(
+        self, baseline, api_lat1, api_lat2, threshold, expect_equivalent
+    ):
+        """Test equivalence against the default and a custom distance threshold."""
+        forecast1 = dataclasses.replace(baseline, api_lat=api_lat1)
+        forecast2 = dataclasses.replace(baseline, api_lat=api_lat2)
+        kwargs = {} if threshold is None else {"threshold_meters": threshold}
 
-        # Should be equivalent at 2000m threshold
-        assert forecast1.is_equivalent(forecast2, threshold_meters=2000)
+        assert forecast1.is_equivalent(forecast2, **kwargs) is expect_equivalent
 
 
 class TestForecastEquality:
     """Tests for Forecast.__eq__ method."""
 
-    def test_equal_forecasts(self):
+    def test_equal_forecasts(self, baseline):
         """Test that equal forecasts compare as equal."""
-        forecast1 = create_forecast()
-        forecast2 = create_forecast()
-        assert forecast1 == forecast2
+        assert baseline == create_forecast()
 
-    def test_different_data_not_equal(self):
+    def test_different_data_not_equal(self, baseline):
         """Test that forecasts with different data are not equal."""
-        forecast1 = create_forecast()
-        forecast2 = create_forecast()
-        forecast2.hourly_data = {"temperature_2m": (10.0,)}  # Different value
+        other = dataclasses.replace(
+            baseline, hourly_data={"temperature_2m": (10.0,)}  # Different value
+        )
 
-        assert forecast1 != forecast2
+        assert baseline != other
 
-    def test_different_lat_not_equal(self):
+    def test_different_lat_not_equal(self, baseline):
         """Test that forecasts with different requested lat are not equal."""
-        forecast1 = create_forecast(lat=43.48)
-        forecast2 = create_forecast(lat=43.49)
-        assert forecast1 != forecast2
+        assert baseline != dataclasses.replace(baseline, lat=43.49)
 
-    def test_comparison_with_non_forecast(self):
+    def test_comparison_with_non_forecast(self, baseline):
         """Test comparison with non-Forecast returns NotImplemented."""
-        forecast = create_forecast()
-        assert forecast.__eq__("not a forecast") == NotImplemented
-        assert (forecast == "not a forecast") is False
+        assert baseline.__eq__("not a forecast") == NotImplemented
+        assert (baseline == "not a forecast") is False
 
 
 class TestEquivalenceVsEquality:
@@ -134,11 +133,10 @@ class TestEquivalenceVsEquality:
         # But not equal (different requested coordinates)
         assert forecast1 != forecast2
 
-    def test_equal_implies_equivalent(self):
+    def test_equal_implies_equivalent(self, baseline):
         """Test that equal forecasts are always equivalent."""
-        forecast1 = create_forecast()
-        forecast2 = create_forecast()
+        other = dataclasses.replace(baseline)
 
-        assert forecast1 == forecast2
-        assert forecast1.is_equivalent(forecast2)
+        assert baseline == other
+        assert baseline.is_equivalent(other)
 
@@ -1,271 +1,157 @@
 """Tests for Forecast getter methods."""
 
+import dataclasses
+
+import numpy as np
 import pytest
-from datetime import datetime, timezone
 
 from weather.domain.forecast import Forecast
 from weather.domain.quantities import Series
 
+_HOURS = 24
 
-def create_test_forecast() -> Forecast:
-    """Create a test forecast with sample data."""
-    base_time = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
-    hours = 24
-
-    return Forecast(
-        lat=43.48,
-        lon=-110.76,
-        api_lat=43.5,
-        api_lon=-110.75,
-        elevation_m=3000.0,
-        model_id="gfs",
-        model_run_utc=base_time,
-        times_utc=[base_time.replace(hour=h) for h in range(hours)],
-        hourly_data={
-            "temperature_2m": tuple(float(-10 + i) for i in range(hours)),
-            "wind_speed_10m": tuple(float(20 + i) for i in range(hours)),
-            "wind_gusts_10m": tuple(float(30 + i) for i in range(hours)),
-            "snowfall": tuple(0.5 for _ in range(hours)),
-            "precipitation": tuple(1.0 for _ in range(hours)),
-            "freezing_level_height": tuple(float(2000 + i * 10) for i in range(hours)),
-        },
-        hourly_units={
-            "temperature_2m": "C",
-            "wind_speed_10m": "kmh",
-            "wind_gusts_10m": "kmh",
-            "snowfall": "cm",
-            "precipitation": "mm",
-            "freezing_level_height": "m",
-        },
-    )
-
-
-class TestTemperatureGetter:
-    """Tests for get_temperature_2m."""
-
-    def test_returns_series(self):
-        """Test that getter returns a Series."""
-        forecast = create_test_forecast()
-        result = forecast.get_temperature_2m()
-
-        assert isinstance(result, Series)
-        assert len(result) == 24
-
-    def test_default_unit_is_celsius(self):
-        """Test that default unit is Celsius."""
-        forecast = create_test_forecast()
-        result = forecast.get_temperature_2m()
-
-        assert result.unit == "C"
-        assert result.values[0] == -10.0
-
-    def test_converts_to_fahrenheit(self):
-        """Test conversion to Fahrenheit."""
-        forecast = create_test_forecast()
-        result = forecast.get_temperature_2m(unit="F")
-
-        assert result.unit == "F"
-        # -10°C = 14°F
-        assert result.values[0] == 14.0
-
-    def test_converts_to_kelvin(self):
-        """Test conversion to Kelvin."""
-        forecast = create_test_forecast()
-        result = forecast.get_temperature_2m(unit="K")
-
-        assert result.unit == "K"
-        # -10°C = 263.15K
-        assert abs(result.values[0] - 263.15) < 0.01
-
-
-class TestWindSpeedGetter:
-    """Tests for get_wind_speed_10m."""
+# Expected series for the canonical forecast (see conftest.py), built once
+_F_TEMP = np.arange(-10, 14) * 9 / 5 + 32
+_K_TEMP = np.arange(-10, 14) + 273.15
+_WIND_ARR = np.arange(20.0, 44.0)
+_GUSTS_ARR = np.arange(30.0, 54.0)
+_SNOW_ARR = np.full(_HOURS, 0.5)
+_PRECIP_ARR = np.full(_HOURS, 1.0)
+_FREEZING_ARR = np.arange(2000.0, 2240.0, 10.0)
 
-    def test_returns_series(self):
-        """Test that getter returns a Series."""
-        forecast = create_test_forecast()
-        result = forecast.get_wind_speed_10m()
 
-        assert isinstance(result, Series)
-        assert len(result) == 24
-
-    def test_default_unit_is_kmh(self):
-        """Test that default unit is km/h."""
-        forecast = create_test_forecast()
-        result = forecast.get_wind_speed_10m()
-
-        assert result.unit == "kmh"
-        assert result.values[0] == 20.0
-
-    def test_converts_to_mph(self):
-        """Test conversion to mph."""
-        forecast = create_test_forecast()
-        result = forecast.get_wind_speed_10m(unit="mph")
-
-        assert result.unit == "mph"
-        # 20 km/h ≈ 12.43 mph
-        assert abs(result.values[0] - 12.43) < 0.1
-
-    def test_converts_to_ms(self):
-        """Test conversion to m/s."""
-        forecast = create_test_forecast()
-        result = forecast.get_wind_speed_10m(unit="ms")
-
-        assert result.unit == "ms"
-        # 20 km/h ≈ 5.56 m/s
-        assert abs(result.values[0] - 5.56) < 0.1
-
-
-class TestWindGustsGetter:
-    """Tests for get_wind_gusts_10m."""
-
-    def test_returns_series(self):
-        """Test that getter returns a Series."""
-        forecast = create_test_forecast()
-        result = forecast.get_wind_gusts_10m()
-
-        assert isinstance(result, Series)
-        assert result.values[0] == 30.0
+@pytest.fixture
+def mutable_forecast(canonical_forecast_24h) -> Forecast:
+    """Per-test copy of the shared forecast with its own hourly_data dict."""
+    return dataclasses.replace(
+        canonical_forecast_24h, hourly_data=dict(canonical_forecast_24h.hourly_data)
+    )
 
-    def test_converts_to_knots(self):
-        """Test conversion to knots."""
-        forecast = create_test_forecast()
-        result = forecast.get_wind_gusts_10m(unit="kn")
 
-        assert result.unit == "kn"
-        # 30 km/h ≈ 16.2 knots
-        assert abs(result.values[0] - 16.2) < 0.1
+_GETTERS = [
+    "get_temperature_2m",
+    "get_wind_speed_10m",
+    "get_wind_gusts_10m",
+    "get_snowfall",
+    "get_precipitation",
+    "get_freezing_level_height",
+]
 
 
-class TestSnowfallGetter:
-    """Tests for get_snowfall."""
+class TestSeriesGetters:
+    """Tests for the hourly series getters."""
 
-    def test_returns_series(self):
-        """Test that getter returns a Series."""
-        forecast = create_test_forecast()
-        result = forecast.get_snowfall()
+    @pytest.mark.parametrize("getter", _GETTERS)
+    def test_returns_series(self, canonical_forecast_24h, getter):
+        """Test that each getter returns a full-length Series."""
+        result = getattr(canonical_forecast_24h, getter)()
 
         assert isinstance(result, Series)
         assert len(result) == 24
 
-    def test_default_unit_is_cm(self):
-        """Test that default unit is cm."""
-        forecast = create_test_forecast()
-        result = forecast.get_snowfall()
-
-        assert result.unit == "cm"
-        assert result.values[0] == 0.5
-
-    def test_converts_to_inches(self):
-        """Test conversion to inches."""
-        forecast = create_test_forecast()
-        result = forecast.get_snowfall(unit="in")
-
-        assert result.unit == "in"
-        # 0.5 cm ≈ 0.197 in
-        assert abs(result.values[0] - 0.197) < 0.01
-
-
-class TestPrecipitationGetter:
-    """Tests for get_precipitation."""
-
-    def test_returns_series(self):
-        """Test that getter returns a Series."""
-        forecast = create_test_forecast()
-        result = forecast.get_precipitation()
-
-        assert isinstance(result, Series)
-
-    def test_default_unit_is_mm(self):
-        """Test that default unit is mm."""
-        forecast = create_test_forecast()
-        result = forecast.get_precipitation()
-
-        assert result.unit == "mm"
-
-    def test_converts_to_inches(self):
-        """Test conversion to inches."""
-        forecast = create_test_forecast()
-        result = forecast.get_precipitation(unit="in")
-
-        assert result.unit == "in"
-        # 1mm ≈ 0.0394 in
-        assert abs(result.values[0] - 0.0394) < 0.001
-
-
-class TestFreezingLevelGetter:
-    """Tests for get_freezing_level_height."""
-
-    def test_returns_series(self):
-        """Test that getter returns a Series."""
-        forecast = create_test_forecast()
-        result = forecast.get_freezing_level_height()
-
-        assert isinstance(result, Series)
-
-    def test_default_unit_is_meters(self):
-        """Test that default unit is meters."""
-        forecast = create_test_forecast()
-        result = forecast.get_freezing_level_height()
-
-        assert result.unit == "m"
-        assert result.values[0] == 2000.0
-
-    def test_converts_to_feet(self):
-        """Test conversion to feet."""
-        forecast = create_test_forecast()
-        result = forecast.get_freezing_level_height(unit="ft")
+    @pytest.mark.parametrize(
+        "getter,unit,expected",
+        [
+            ("get_temperature_2m", "C", -10.0),
+            ("get_wind_speed_10m", "kmh", 20.0),
+            ("get_wind_gusts_10m", "kmh", 30.0),
+            ("get_snowfall", "cm", 0.5),
+            ("get_precipitation", "mm", 1.0),
+            ("get_freezing_level_height", "m", 2000.0),
+        ],
+    )
+    def test_default_unit(self, canonical_forecast_24h, getter, unit, expected):
+        """Test each getter's default unit and unconverted first value."""
+        result = getattr(canonical_forecast_24h, getter)()
+
+        assert result.unit == unit
+        assert result.values[0] == expected
+
+    @pytest.mark.parametrize(
+        "getter,unit,expected,rel",
+        [
+            ("get_temperature_2m", "F", _F_TEMP, 1e-9),  # -10°C = 14°F
+            ("get_temperature_2m", "K", _K_TEMP, 1e-9),  # -10°C = 263.15K
+            ("get_wind_speed_10m", "mph", _WIND_ARR / 1.609344, 1e-3),  # 20 km/h ≈ 12.43 mph
+            ("get_wind_speed_10m", "ms", _WIND_ARR / 3.6, 1e-3),  # 20 km/h ≈ 5.56 m/s
+            ("get_wind_gusts_10m", "kn", _GUSTS_ARR / 1.852, 1e-3),  # 30 km/h ≈ 16.2 knots
+            ("get_snowfall", "in", _SNOW_ARR / 2.54, 1e-3),  # 0.5 cm ≈ 0.197 in
+            ("get_precipitation", "in", _PRECIP_ARR / 25.4, 1e-3),  # 1mm ≈ 0.0394 in
+            ("get_freezing_level_height", "ft", _FREEZING_ARR / 0.3048, 1e-3),  # 2000m ≈ 6562 ft
+        ],
+    )
+    def test_unit_conversion(self, canonical_forecast_24h, getter, unit, expected, rel):
+        """Test conversion of each getter to a non-default unit."""
+        result = getattr(canonical_forecast_24h, getter)(unit=unit)
 
-        assert result.unit == "ft"
-        # 2000m ≈ 6562 ft
-        assert abs(result.values[0] - 6562) < 1
+        assert result.unit == unit
+        assert result.values == pytest.approx(expected, rel=rel)
 
 
 class TestAccumulatedSeries:
     """Tests for accumulated series getters."""
 
-    def test_snowfall_accumulated(self):
+    def test_snowfall_accumulated(self, canonical_forecast_24h):
         """Test accumulated snowfall calculation."""
-        forecast = create_test_forecast()
-        result = forecast.get_snowfall_accumulated()
+        result = canonical_forecast_24h.get_snowfall_accumulated()
 
         assert isinstance(result, Series)
         # Each hour adds 0.5 cm
-        assert result.values[0] == 0.5
-        assert result.values[1] == 1.0
-        assert result.values[23] == 12.0  # 24 * 0.5
+        np.testing.assert_allclose(result.values, np.cumsum(np.full(24, 0.5)))
 
-    def test_precipitation_accumulated(self):
+    def test_precipitation_accumulated(self, canonical_forecast_24h):
         """Test accumulated precipitation calculation."""
-        forecast = create_test_forecast()
-        result = forecast.get_precipitation_accumulated()
+        result = canonical_forecast_24h.get_precipitation_accumulated()
 
         assert isinstance(result, Series)
         # Each hour adds 1 mm
-        assert result.values[0] == 1.0
-        assert result.values[23] == 24.0
+        np.testing.assert_allclose(result.values, np.cumsum(np.full(24, 1.0)))
 
-    def test_accumulated_with_unit_conversion(self):
+    def test_accumulated_with_unit_conversion(self, canonical_forecast_24h):
         """Test accumulated series with unit conversion."""
-        forecast = create_test_forecast()
-        result = forecast.get_snowfall_accumulated(unit="in")
+        result = canonical_forecast_24h.get_snowfall_accumulated(unit="in")
 
         assert result.unit == "in"
         # 12 cm total ≈ 4.72 in
-        assert abs(result.values[23] - 4.72) < 0.1
+        np.testing.assert_allclose(
+            result.values, np.cumsum(np.full(24, 0.5)) / 2.54, rtol=1e-6
+        )
 
 
+class TestEnhancedSnowfall:
+    """Tests for the enhanced snowfall and rain getters."""
+
+    def test_series_values_are_float_tuples(self, canonical_forecast_24h):
+        """Test that enhanced snowfall and rain come back as tuples of floats."""
+        for series in (
+            canonical_forecast_24h.get_enhanced_snowfall(),
+            canonical_forecast_24h.get_rain(),
+        ):
+            assert isinstance(series.values, tuple)
+            assert len(series) == _HOURS
+            assert all(type(v) is float for v in series.values)
+
+    def test_total_matches_accumulated(self, canonical_forecast_24h):
+        """Test that the enhanced total equals the last accumulated value."""
+        total = canonical_forecast_24h.get_enhanced_snowfall_total()
+        accumulated = canonical_forecast_24h.get_enhanced_snowfall_accumulated()
+
+        assert total.value == accumulated.values[-1]
+
+    def test_rain_total_matches_series(self, canonical_forecast_24h):
+        """Test that the rain total equals the sum of the hourly rain series."""
+        total = canonical_forecast_24h.get_rain_total()
+
+        assert total.value == sum(canonical_forecast_24h.get_rain().values)
+
 class TestMissingVariable:
     """Tests for missing variable handling."""
 
-    def test_missing_variable_raises_keyerror(self):
+    def test_missing_variable_raises_keyerror(self, mutable_forecast):
         """Test that accessing missing variable raises KeyError."""
-        forecast = create_test_forecast()
         # Remove a variable
-        del forecast.hourly_data["wind_gusts_10m"]
-
-        with pytest.raises(KeyError) as exc_info:
-            forecast.get_wind_gusts_10m()
+        del mutable_forecast.hourly_data["wind_gusts_10m"]
 
-        assert "wind_gusts_10m" in str(exc_info.value)
+        with pytest.raises(KeyError, match="wind_gusts_10m"):
+            mutable_forecast.get_wind_gusts_10m()
 
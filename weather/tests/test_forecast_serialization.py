@@ -1,21 +1,57 @@
 """Tests for Forecast serialization and properties."""
 
+import dataclasses
+import functools
+
 import pytest
 from datetime import datetime, timezone, timedelta
 
 from weather.domain.forecast import Forecast
 
 
+@functools.cache
+def _hourly(hours: int) -> dict[str, tuple[float, ...]]:
+    """Hourly test data for a given length, built once per length."""
+    return {
+        "temperature_2m": tuple(map(float, range(-10, hours - 10))),
+        "snowfall": (0.5,) * hours,
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _times(base_iso: str, hours: int) -> tuple[datetime, ...]:
+    """Hourly timestamps starting at base_iso, built once per (base, length)."""
+    base = datetime.fromisoformat(base_iso)
+    return tuple(base + timedelta(hours=h) for h in range(hours))
+
+
+_ISO_TIMES_24 = tuple(
+    (datetime(2024, 1, 15, tzinfo=timezone.utc) + timedelta(hours=h)).isoformat()
+    for h in range(24)
+)
+
+_REQUIRED_KEYS = ("lat", "lon", "api_lat", "api_lon", "model_id")
+
+_BASE_DICT = {
+    "lat": 43.48,
+    "lon": -110.76,
+    "api_lat": 43.5,
+    "api_lon": -110.75,
+    "model_id": "gfs",
+    "model_run_utc": None,
+    "times_utc": [],
+    "hourly_data": {},
+    "hourly_units": {},
+}
+
+
 def create_test_forecast(
     hours: int = 24,
     naive_times: bool = False,
     naive_model_run: bool = False,
 ) -> Forecast:
     """Create a test forecast with configurable options."""
-    if naive_times:
-        base_time = datetime(2024, 1, 15, 0, 0, 0)
-    else:
-        base_time = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+    base_iso = "2024-01-15T00:00:00" if naive_times else "2024-01-15T00:00:00+00:00"
 
     if naive_model_run:
         model_run = datetime(2024, 1, 15, 0, 0, 0)
@@ -30,11 +66,8 @@ def create_test_forecast(
         elevation_m=3000.0,
         model_id="gfs",
         model_run_utc=model_run,
-        times_utc=[base_time + timedelta(hours=h) for h in range(hours)],
-        hourly_data={
-            "temperature_2m": tuple(float(-10 + i) for i in range(hours)),
-            "snowfall": tuple(0.5 for _ in range(hours)),
-        },
+        times_utc=list(_times(base_iso, hours)),
+        hourly_data=dict(_hourly(hours)),
         hourly_units={
             "temperature_2m": "C",
             "snowfall": "cm",
@@ -42,6 +75,19 @@ def create_test_forecast(
     )
 
 
+@pytest.fixture(scope="module")
+def empty_forecast() -> Forecast:
+    """Shared forecast with no timesteps."""
+    return create_test_forecast(hours=0)
+
+
+@pytest.fixture(scope="module")
+def roundtrip_5h() -> tuple[Forecast, Forecast]:
+    """A 5-hour forecast and its to_dict -> from_dict restoration."""
+    original = create_test_forecast(hours=5)
+    return original, Forecast.from_dict(original.to_dict())
+
+
 class TestForecastProperties:
     """Tests for Forecast property methods."""
 
@@ -50,32 +96,27 @@ class TestForecastProperties:
         forecast = create_test_forecast(hours=48)
         assert forecast.hours_available == 48
 
-    def test_hours_available_empty(self):
+    def test_hours_available_empty(self, empty_forecast):
         """Test hours_available with no data."""
-        forecast = create_test_forecast(hours=0)
-        assert forecast.hours_available == 0
+        assert empty_forecast.hours_available == 0
 
-    def test_forecast_start(self):
+    def test_forecast_start(self, canonical_forecast_24h):
         """Test forecast_start property."""
-        forecast = create_test_forecast(hours=24)
         expected = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
-        assert forecast.forecast_start == expected
+        assert canonical_forecast_24h.forecast_start == expected
 
-    def test_forecast_start_empty(self):
+    def test_forecast_start_empty(self, empty_forecast):
         """Test forecast_start with no data returns None."""
-        forecast = create_test_forecast(hours=0)
-        assert forecast.forecast_start is None
+        assert empty_forecast.forecast_start is None
 
-    def test_forecast_end(self):
+    def test_forecast_end(self, canonical_forecast_24h):
         """Test forecast_end property."""
-        forecast = create_test_forecast(hours=24)
         expected = datetime(2024, 1, 15, 23, 0, 0, tzinfo=timezone.utc)
-        assert forecast.forecast_end == expected
+        assert canonical_forecast_24h.forecast_end == expected
 
-    def test_forecast_end_empty(self):
+    def test_forecast_end_empty(self, empty_forecast):
         """Test forecast_end with no data returns None."""
-        forecast = create_test_forecast(hours=0)
-        assert forecast.forecast_end is None
+        assert empty_forecast.forecast_end is None
 
 
 class TestForecastPostInit:
@@ -94,6 +135,28 @@ class TestForecastPostInit:
         forecast = create_test_forecast(naive_model_run=True)
         assert forecast.model_run_utc.tzinfo == timezone.utc
 
+    def test_forecast_is_immutable(self, canonical_forecast_24h):
+        """Test that Forecast fields cannot be reassigned (frozen dataclass)."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            canonical_forecast_24h.model_id = "ifs"
+
+    def test_trusted_matches_constructor(self):
+        """Test that _trusted builds the same forecast for UTC-aware input."""
+        kwargs = {
+            f.name: getattr(create_test_forecast(hours=3), f.name)
+            for f in dataclasses.fields(Forecast)
+            if f.init
+        }
+
+        assert Forecast._trusted(**kwargs) == Forecast(**kwargs)
+
+    def test_trusted_rejects_missing_field(self):
+        """Test that _trusted raises TypeError for a missing field."""
+        with pytest.raises(TypeError, match="model_id"):
+            Forecast._trusted(
+                lat=43.48, lon=-110.76, api_lat=43.5, api_lon=-110.75, elevation_m=None
+            )
+
     def test_utc_times_unchanged(self):
         """Test that UTC times remain unchanged."""
         forecast = create_test_forecast(naive_times=False)
@@ -104,58 +167,74 @@ class TestForecastPostInit:
 class TestForecastToDict:
     """Tests for Forecast.to_dict method."""
 
-    def test_basic_to_dict(self):
+    def test_basic_to_dict(self, canonical_forecast_dict_3h):
         """Test basic conversion to dictionary."""
-        forecast = create_test_forecast(hours=3)
-        d = forecast.to_dict()
+        d = canonical_forecast_dict_3h
+        expected = {
+            "lat": 43.48,
+            "lon": -110.76,
+            "api_lat": 43.5,
+            "api_lon": -110.75,
+            "elevation_m": 3000.0,
+            "model_id": "gfs",
+        }
 
-        assert d["lat"] == 43.48
-        assert d["lon"] == -110.76
-        assert d["api_lat"] == 43.5
-        assert d["api_lon"] == -110.75
-        assert d["elevation_m"] == 3000.0
-        assert d["model_id"] == "gfs"
+        assert {k: d[k] for k in expected} == expected
 
-    def test_to_dict_model_run_isoformat(self):
+    def test_to_dict_model_run_isoformat(self, canonical_forecast_dict_3h):
         """Test that model_run_utc is converted to ISO format."""
-        forecast = create_test_forecast()
-        d = forecast.to_dict()
+        d = canonical_forecast_dict_3h
 
         assert isinstance(d["model_run_utc"], str)
         assert "2024-01-15" in d["model_run_utc"]
 
-    def test_to_dict_none_model_run(self):
+    def test_to_dict_none_model_run(self, canonical_forecast_24h):
         """Test to_dict with None model_run_utc."""
-        forecast = create_test_forecast()
-        forecast.model_run_utc = None
-
-        d = forecast.to_dict()
+        d = dataclasses.replace(canonical_forecast_24h, model_run_utc=None).to_dict()
         assert d["model_run_utc"] is None
 
-    def test_to_dict_times_isoformat(self):
+    def test_to_dict_times_isoformat(self, canonical_forecast_dict_3h):
         """Test that times_utc are converted to ISO format."""
-        forecast = create_test_forecast(hours=3)
-        d = forecast.to_dict()
+        d = canonical_forecast_dict_3h
+
+        assert d["times_utc"] == list(_ISO_TIMES_24[:3])
+
+    def test_to_dict_times_non_utc_offset(self, canonical_forecast_24h):
+        """Test that non-UTC aware times keep their own offset in ISO output."""
+        mst = timezone(timedelta(hours=-7))
+        times = [datetime(2024, 1, 15, h, 0, 0, tzinfo=mst) for h in range(2)]
+
+        d = dataclasses.replace(canonical_forecast_24h, times_utc=times).to_dict()
+
+        assert d["times_utc"] == [t.isoformat() for t in times]
+
+    @pytest.mark.parametrize(
+        "later",
+        [
+            datetime(2024, 1, 15, 1, 0, 0, 500_000, tzinfo=timezone.utc),
+            datetime(2024, 1, 14, 18, 0, 0, tzinfo=timezone(timedelta(hours=-7))),
+        ],
+        ids=["microseconds", "non_utc_offset"],
+    )
+    def test_to_dict_times_mixed_after_utc_start(self, canonical_forecast_24h, later):
+        """Test that a later non-conforming time is not rewritten by the fast path."""
+        times = [datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc), later]
 
-        assert isinstance(d["times_utc"], list)
-        assert len(d["times_utc"]) == 3
-        for t in d["times_utc"]:
-            assert isinstance(t, str)
-            assert "2024-01-15" in t
+        d = dataclasses.replace(canonical_forecast_24h, times_utc=times).to_dict()
 
-    def test_to_dict_hourly_data_as_lists(self):
+        assert d["times_utc"] == [t.isoformat() for t in times]
+
+    def test_to_dict_hourly_data_as_lists(self, canonical_forecast_dict_3h):
         """Test that hourly_data tuples are converted to lists."""
-        forecast = create_test_forecast(hours=3)
-        d = forecast.to_dict()
+        d = canonical_forecast_dict_3h
 
         assert isinstance(d["hourly_data"], dict)
         assert isinstance(d["hourly_data"]["temperature_2m"], list)
         assert isinstance(d["hourly_data"]["snowfall"], list)
 
-    def test_to_dict_hourly_units_preserved(self):
+    def test_to_dict_hourly_units_preserved(self, canonical_forecast_dict_3h):
         """Test that hourly_units are preserved."""
-        forecast = create_test_forecast()
-        d = forecast.to_dict()
+        d = canonical_forecast_dict_3h
 
         assert d["hourly_units"]["temperature_2m"] == "C"
         assert d["hourly_units"]["snowfall"] == "cm"
@@ -167,17 +246,10 @@ class TestForecastFromDict:
     def test_basic_from_dict(self):
         """Test basic creation from dictionary."""
         data = {
-            "lat": 43.48,
-            "lon": -110.76,
-            "api_lat": 43.5,
-            "api_lon": -110.75,
+            **_BASE_DICT,
             "elevation_m": 3000.0,
-            "model_id": "gfs",
             "model_run_utc": "2024-01-15T00:00:00+00:00",
-            "times_utc": [
-                "2024-01-15T00:00:00+00:00",
-                "2024-01-15T01:00:00+00:00",
-            ],
+            "times_utc": _ISO_TIMES_24[:2],
             "hourly_data": {
                 "temperature_2m": [-10.0, -9.0],
             },
@@ -195,17 +267,7 @@ class TestForecastFromDict:
 
     def test_from_dict_parses_model_run(self):
         """Test that model_run_utc string is parsed to datetime."""
-        data = {
-            "lat": 43.48,
-            "lon": -110.76,
-            "api_lat": 43.5,
-            "api_lon": -110.75,
-            "model_id": "gfs",
-            "model_run_utc": "2024-01-15T06:00:00+00:00",
-            "times_utc": [],
-            "hourly_data": {},
-            "hourly_units": {},
-        }
+        data = {**_BASE_DICT, "model_run_utc": "2024-01-15T06:00:00+00:00"}
 
         forecast = Forecast.from_dict(data)
 
@@ -214,36 +276,12 @@ class TestForecastFromDict:
 
     def test_from_dict_none_model_run(self):
         """Test from_dict with None model_run_utc."""
-        data = {
-            "lat": 43.48,
-            "lon": -110.76,
-            "api_lat": 43.5,
-            "api_lon": -110.75,
-            "model_id": "gfs",
-            "model_run_utc": None,
-            "times_utc": [],
-            "hourly_data": {},
-            "hourly_units": {},
-        }
-
-        forecast = Forecast.from_dict(data)
+        forecast = Forecast.from_dict(_BASE_DICT)
         assert forecast.model_run_utc is None
 
     def test_from_dict_parses_times(self):
         """Test that times_utc strings are parsed to datetimes."""
-        data = {
-            "lat": 43.48,
-            "lon": -110.76,
-            "api_lat": 43.5,
-            "api_lon": -110.75,
-            "model_id": "gfs",
-            "times_utc": [
-                "2024-01-15T00:00:00+00:00",
-                "2024-01-15T01:00:00+00:00",
-            ],
-            "hourly_data": {},
-            "hourly_units": {},
-        }
+        data = {**_BASE_DICT, "times_utc": _ISO_TIMES_24[:2]}
 
         forecast = Forecast.from_dict(data)
 
@@ -253,51 +291,37 @@ class TestForecastFromDict:
 
     def test_from_dict_converts_lists_to_tuples(self):
         """Test that hourly_data lists are converted to tuples."""
-        data = {
-            "lat": 43.48,
-            "lon": -110.76,
-            "api_lat": 43.5,
-            "api_lon": -110.75,
-            "model_id": "gfs",
-            "times_utc": [],
-            "hourly_data": {
-                "temperature_2m": [-10.0, -9.0, -8.0],
-            },
-            "hourly_units": {},
-        }
+        data = {**_BASE_DICT, "hourly_data": {"temperature_2m": [-10.0, -9.0, -8.0]}}
 
         forecast = Forecast.from_dict(data)
 
         assert isinstance(forecast.hourly_data["temperature_2m"], tuple)
 
-    def test_from_dict_missing_optional_fields(self):
-        """Test from_dict with missing optional fields."""
-        data = {
-            "lat": 43.48,
-            "lon": -110.76,
-            "api_lat": 43.5,
-            "api_lon": -110.75,
-            "model_id": "gfs",
-        }
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("elevation_m", None),
+            ("model_run_utc", None),
+            ("times_utc", []),
+            ("hourly_data", {}),
+            ("hourly_units", {}),
+        ],
+    )
+    def test_from_dict_missing_optional_fields(self, attr, expected):
+        """Test from_dict defaults for missing optional fields."""
+        data = {k: _BASE_DICT[k] for k in _REQUIRED_KEYS}
 
         forecast = Forecast.from_dict(data)
 
-        assert forecast.elevation_m is None
-        assert forecast.model_run_utc is None
-        assert forecast.times_utc == []
-        assert forecast.hourly_data == {}
-        assert forecast.hourly_units == {}
+        assert getattr(forecast, attr) == expected
 
 
 class TestForecastRoundTrip:
     """Tests for to_dict -> from_dict round trip."""
 
-    def test_round_trip_preserves_data(self):
+    def test_round_trip_preserves_data(self, roundtrip_5h):
         """Test that round trip preserves all data."""
-        original = create_test_forecast(hours=24)
-
-        d = original.to_dict()
-        restored = Forecast.from_dict(d)
+        original, restored = roundtrip_5h
 
         assert restored.lat == original.lat
         assert restored.lon == original.lon
@@ -308,23 +332,17 @@ class TestForecastRoundTrip:
         assert len(restored.times_utc) == len(original.times_utc)
         assert restored.hourly_units == original.hourly_units
 
-    def test_round_trip_preserves_hourly_data(self):
+    def test_round_trip_preserves_hourly_data(self, roundtrip_5h):
         """Test that round trip preserves hourly data values."""
-        original = create_test_forecast(hours=5)
-
-        d = original.to_dict()
-        restored = Forecast.from_dict(d)
+        original, restored = roundtrip_5h
 
         for var in original.hourly_data:
             assert var in restored.hourly_data
             assert restored.hourly_data[var] == original.hourly_data[var]
 
-    def test_round_trip_preserves_times(self):
+    def test_round_trip_preserves_times(self, roundtrip_5h):
         """Test that round trip preserves times correctly."""
-        original = create_test_forecast(hours=5)
-
-        d = original.to_dict()
-        restored = Forecast.from_dict(d)
+        original, restored = roundtrip_5h
 
         # Compare times (may differ by microseconds due to ISO format)
         for orig_t, rest_t in zip(original.times_utc, restored.times_utc):
@@ -8,6 +8,52 @@ from weather.parsing.openmeteo_parser import parse_openmeteo_response
 from weather.domain.forecast import Forecast
 from weather.domain.errors import ApiError
 
+pytestmark = pytest.mark.parser
+
+
+# Forecast times used in assertions
+_DT_00Z = datetime(2024, 1, 15, 0, tzinfo=timezone.utc)
+_DT_01Z = _DT_00Z.replace(hour=1)
+
+# Unix timestamps for the mock forecast window
+_TS_START = int(_DT_00Z.timestamp())
+_TS_PLUS_3H = _TS_START + 3 * 3600
+_TS_PLUS_1D = _TS_START + 86400
+
+# Shared read-only 3-hour series with a missing (NaN) middle value
+_NAN_ARRAY = np.array([1.0, np.nan, 3.0], dtype=np.float64)
+_NAN_ARRAY.setflags(write=False)
+
+
+def _frozen(*values: float) -> np.ndarray:
+    """Build a read-only float64 array from literal values."""
+    array = np.array(values, dtype=np.float64)
+    array.setflags(write=False)
+    return array
+
+
+# Client-side hourly order with an extra temperature variable before snowfall
+_REQ_HOURLY_ORDER = (
+    "temperature_2m",
+    "wind_speed_10m",
+    "wind_gusts_10m",
+    "apparent_temperature",  # extra temperature variable
+    "snowfall",
+    "precipitation",
+    "freezing_level_height",
+)
+
+# FlatBuffers variables matching _REQ_HOURLY_ORDER, with mixed unit categories
+_MISALIGNED_VARIABLES = {
+    0: (_frozen(-5.0, -4.5, -4.0), 1),  # temperature_2m (C)
+    1: (_frozen(20.0, 21.0, 22.0), 8),  # wind_speed_10m (kmh)
+    2: (_frozen(30.0, 31.0, 32.0), 8),  # wind_gusts_10m (kmh)
+    3: (_frozen(12.0, 13.0, 14.0), 2),  # apparent_temperature (F)
+    4: (_frozen(0.5, 0.7, 1.0), 4),  # snowfall (cm)
+    5: (_frozen(1.0, 1.1, 1.2), 3),  # precipitation (mm)
+    6: (_frozen(2000.0, 2005.0, 2010.0), 5),  # freezing_level_height (m)
+}
+
 
 # -----------------------------------------------------------------------------
 # Mock classes for FlatBuffers response simulation
@@ -42,9 +88,38 @@ class MockFlatBuffersResponse:
         return self._hourly
 
 
+# Unit enums of the default variables: 1=C, 8=kmh, 4=cm, 3=mm, 5=m
+_DEFAULT_UNITS = np.array([1, 8, 8, 4, 3, 5], dtype=np.int8)
+_DEFAULT_UNITS.setflags(write=False)
+
+
+def _default_values(hours: int) -> np.ndarray:
+    """Default series stacked into one read-only (n_vars, hours) array.
+
+    Rows: temp (C), wind (kmh), gusts (kmh), snow (cm), precip (mm), freeze (m)
+    """
+    t = np.arange(hours, dtype=np.float64)
+    values = np.stack(
+        [
+            -5.0 + 0.5 * t,
+            20.0 + t,
+            35.0 + t,
+            np.full(hours, 0.5),
+            np.full(hours, 1.0),
+            2000.0 + 10.0 * t,
+        ]
+    )
+    values.setflags(write=False)
+    return values
+
+
 class MockHourly:
     """Mock hourly data from Open-Meteo FlatBuffers."""
 
+    # Default 24-hour values, shared by every default instance
+    _DEFAULT_HOURS = 24
+    _DEFAULT_VALUES = _default_values(_DEFAULT_HOURS)
+
     def __init__(
         self,
         time_start: int | None = None,
@@ -53,28 +128,32 @@ class MockHourly:
         variables: dict | None = None,
     ):
         if time_start is None:
-            time_start = int(datetime(2024, 1, 15, 0, tzinfo=timezone.utc).timestamp())
+            time_start = _TS_START
         if time_end is None:
-            time_end = int(datetime(2024, 1, 16, 0, tzinfo=timezone.utc).timestamp())
+            time_end = _TS_PLUS_1D
 
         self._time_start = time_start
         self._time_end = time_end
         self._interval = interval
 
-        # Default variables: index -> (values_array, unit_enum)
-        # Unit enums: 1=C, 8=kmh, 4=cm, 3=mm, 5=m
+        # Variable wrappers are built once and handed out by Variables()
         if variables is None:
             hours = (time_end - time_start) // interval
-            self._variables = {
-                0: (np.array([-5.0 + i * 0.5 for i in range(hours)]), 1),  # temp, C
-                1: (np.array([20.0 + i for i in range(hours)]), 8),  # wind, kmh
-                2: (np.array([35.0 + i for i in range(hours)]), 8),  # gusts, kmh
-                3: (np.array([0.5 for _ in range(hours)]), 4),  # snow, cm
-                4: (np.array([1.0 for _ in range(hours)]), 3),  # precip, mm
-                5: (np.array([2000.0 + i * 10 for i in range(hours)]), 5),  # freeze, m
+            if hours == self._DEFAULT_HOURS:
+                self._values = self._DEFAULT_VALUES
+            else:
+                self._values = _default_values(hours)
+            self._units = _DEFAULT_UNITS
+            self._pool = {
+                index: MockVariable(row, int(unit))
+                for index, (row, unit) in enumerate(zip(self._values, self._units, strict=True))
             }
         else:
-            self._variables = variables
+            # Custom variables: index -> (values_array, unit_enum)
+            self._pool = {
+                index: MockVariable(np.ascontiguousarray(values), unit)
+                for index, (values, unit) in variables.items()
+            }
 
     def Time(self) -> int:
         return self._time_start
@@ -86,17 +165,18 @@ class MockHourly:
         return self._interval
 
     def Variables(self, index: int):
-        if index in self._variables:
-            values, unit = self._variables[index]
-            return MockVariable(values, unit)
-        return None
+        return self._pool.get(index)
 
 
 class MockVariable:
     """Mock variable from Open-Meteo FlatBuffers."""
 
+    __slots__ = ("_values", "_unit")
+
     def __init__(self, values: np.ndarray, unit: int):
-        self._values = values
+        # Read-only view, as the real FlatBuffers accessor returns
+        self._values = values.view()
+        self._values.flags.writeable = False
         self._unit = unit
 
     def ValuesAsNumpy(self) -> np.ndarray:
@@ -106,16 +186,55 @@ class MockVariable:
         return self._unit
 
 
+def _json_response(
+    times: list[str],
+    units: dict[str, str] | None = None,
+    elevation: float | None = None,
+    **series: list,
+) -> dict:
+    """Build a JSON API response with the given timestamps and hourly series."""
+    response = {
+        "latitude": 43.5,
+        "longitude": -110.75,
+        "hourly_units": units or {},
+        "hourly": {"time": times, **series},
+    }
+    if elevation is not None:
+        response["elevation"] = elevation
+    return response
+
+
+@pytest.fixture(scope="module")
+def default_hourly() -> MockHourly:
+    """Default 24-hour FlatBuffers hourly block; tests must not mutate it."""
+    return MockHourly()
+
+
+@pytest.fixture(scope="module")
+def default_response(default_hourly) -> MockFlatBuffersResponse:
+    """Default FlatBuffers response wrapping default_hourly."""
+    return MockFlatBuffersResponse(hourly=default_hourly)
+
+
+@pytest.fixture(scope="module")
+def default_forecast(default_response) -> Forecast:
+    """default_response parsed once for the read-only assertion tests."""
+    return parse_openmeteo_response(
+        response=default_response,
+        requested_lat=43.48,
+        requested_lon=-110.76,
+        model_id="gfs",
+    )
+
+
 class TestParseJsonResponse:
     """Tests for parsing JSON API responses."""
 
     def test_parses_basic_response(self):
         """Test parsing a basic JSON response."""
-        response = {
-            "latitude": 43.5,
-            "longitude": -110.75,
-            "elevation": 3000,
-            "hourly_units": {
+        response = _json_response(
+            ["2024-01-15T00:00", "2024-01-15T01:00", "2024-01-15T02:00"],
+            units={
                 "time": "iso8601",
                 "temperature_2m": "°C",
                 "wind_speed_10m": "km/h",
@@ -124,20 +243,14 @@ class TestParseJsonResponse:
                 "precipitation": "mm",
                 "freezing_level_height": "m",
             },
-            "hourly": {
-                "time": [
-                    "2024-01-15T00:00",
-                    "2024-01-15T01:00",
-                    "2024-01-15T02:00",
-                ],
-                "temperature_2m": [-5.0, -4.5, -4.0],
-                "wind_speed_10m": [20.0, 22.0, 25.0],
-                "wind_gusts_10m": [35.0, 38.0, 42.0],
-                "snowfall": [0.5, 0.8, 1.0],
-                "precipitation": [1.0, 1.5, 2.0],
-                "freezing_level_height": [2000, 2050, 2100],
-            },
-        }
+            elevation=3000,
+            temperature_2m=[-5.0, -4.5, -4.0],
+            wind_speed_10m=[20.0, 22.0, 25.0],
+            wind_gusts_10m=[35.0, 38.0, 42.0],
+            snowfall=[0.5, 0.8, 1.0],
+            precipitation=[1.0, 1.5, 2.0],
+            freezing_level_height=[2000, 2050, 2100],
+        )
 
         forecast = parse_openmeteo_response(
             response=response,
@@ -157,19 +270,12 @@ class TestParseJsonResponse:
 
     def test_parses_units(self):
         """Test that units are correctly parsed."""
-        response = {
-            "latitude": 43.5,
-            "longitude": -110.75,
-            "hourly_units": {
-                "temperature_2m": "°C",
-                "wind_speed_10m": "km/h",
-            },
-            "hourly": {
-                "time": ["2024-01-15T00:00"],
-                "temperature_2m": [-5.0],
-                "wind_speed_10m": [20.0],
-            },
-        }
+        response = _json_response(
+            ["2024-01-15T00:00"],
+            units={"temperature_2m": "°C", "wind_speed_10m": "km/h"},
+            temperature_2m=[-5.0],
+            wind_speed_10m=[20.0],
+        )
 
         forecast = parse_openmeteo_response(
             response=response,
@@ -183,17 +289,11 @@ class TestParseJsonResponse:
 
     def test_handles_none_values(self):
         """Test handling of None/null values in data."""
-        response = {
-            "latitude": 43.5,
-            "longitude": -110.75,
-            "hourly_units": {
-                "temperature_2m": "°C",
-            },
-            "hourly": {
-                "time": ["2024-01-15T00:00", "2024-01-15T01:00"],
-                "temperature_2m": [-5.0, None],
-            },
-        }
+        response = _json_response(
+            ["2024-01-15T00:00", "2024-01-15T01:00"],
+            units={"temperature_2m": "°C"},
+            temperature_2m=[-5.0, None],
+        )
 
         forecast = parse_openmeteo_response(
             response=response,
@@ -207,15 +307,7 @@ class TestParseJsonResponse:
 
     def test_elevation_override(self):
         """Test that elevation override is applied."""
-        response = {
-            "latitude": 43.5,
-            "longitude": -110.75,
-            "elevation": 2500,  # API elevation
-            "hourly_units": {},
-            "hourly": {
-                "time": ["2024-01-15T00:00"],
-            },
-        }
+        response = _json_response(["2024-01-15T00:00"], elevation=2500)  # API elevation
 
         forecast = parse_openmeteo_response(
             response=response,
@@ -229,17 +321,7 @@ class TestParseJsonResponse:
 
     def test_parses_iso8601_timestamps(self):
         """Test parsing of ISO 8601 timestamps."""
-        response = {
-            "latitude": 43.5,
-            "longitude": -110.75,
-            "hourly_units": {},
-            "hourly": {
-                "time": [
-                    "2024-01-15T00:00",
-                    "2024-01-15T01:00",
-                ],
-            },
-        }
+        response = _json_response(["2024-01-15T00:00", "2024-01-15T01:00"])
 
         forecast = parse_openmeteo_response(
             response=response,
@@ -248,8 +330,8 @@ class TestParseJsonResponse:
             model_id="gfs",
         )
 
-        assert forecast.times_utc[0] == datetime(2024, 1, 15, 0, 0, tzinfo=timezone.utc)
-        assert forecast.times_utc[1] == datetime(2024, 1, 15, 1, 0, tzinfo=timezone.utc)
+        assert forecast.times_utc[0] == _DT_00Z
+        assert forecast.times_utc[1] == _DT_01Z
 
 
 class TestParseErrors:
@@ -262,7 +344,7 @@ class TestParseErrors:
             "reason": "Invalid coordinates",
         }
 
-        with pytest.raises(ApiError) as exc_info:
+        with pytest.raises(ApiError, match="Invalid coordinates"):
             parse_openmeteo_response(
                 response=response,
                 requested_lat=999,  # Invalid
@@ -270,8 +352,6 @@ class TestParseErrors:
                 model_id="gfs",
             )
 
-        assert "Invalid coordinates" in str(exc_info.value)
-
     def test_empty_hourly_raises(self):
         """Test that empty hourly data raises ApiError."""
         response = {
@@ -308,60 +388,10 @@ class TestParseErrors:
 class TestModelRunInference:
     """Tests for model run time inference."""
 
-    def test_infers_model_run_time(self):
-        """Test that model run time is inferred from timestamps."""
-        response = {
-            "latitude": 43.5,
-            "longitude": -110.75,
-            "hourly_units": {},
-            "hourly": {
-                "time": [
-                    "2024-01-15T06:00",  # 06Z run
-                    "2024-01-15T07:00",
-                ],
-            },
-        }
-
-        forecast = parse_openmeteo_response(
-            response=response,
-            requested_lat=43.48,
-            requested_lon=-110.76,
-            model_id="gfs",
-        )
-
-        # Should infer 06Z model run
-        assert forecast.model_run_utc == datetime(2024, 1, 15, 6, 0, tzinfo=timezone.utc)
-
-    def test_infers_00z_run(self):
-        """Test inference of 00Z model run."""
-        response = {
-            "latitude": 43.5,
-            "longitude": -110.75,
-            "hourly_units": {},
-            "hourly": {
-                "time": ["2024-01-15T00:00"],
-            },
-        }
-
-        forecast = parse_openmeteo_response(
-            response=response,
-            requested_lat=43.48,
-            requested_lon=-110.76,
-            model_id="gfs",
-        )
-
-        assert forecast.model_run_utc == datetime(2024, 1, 15, 0, 0, tzinfo=timezone.utc)
-
-    def test_infers_12z_run(self):
-        """Test inference of 12Z model run."""
-        response = {
-            "latitude": 43.5,
-            "longitude": -110.75,
-            "hourly_units": {},
-            "hourly": {
-                "time": ["2024-01-15T12:00"],
-            },
-        }
+    @pytest.mark.parametrize("hour", [0, 6, 12])
+    def test_infers_model_run_time(self, hour):
+        """Test that the model run is inferred from the first timestamp."""
+        response = _json_response([f"2024-01-15T{hour:02d}:00"])
 
         forecast = parse_openmeteo_response(
             response=response,
@@ -370,115 +400,54 @@ class TestModelRunInference:
             model_id="gfs",
         )
 
-        assert forecast.model_run_utc == datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        assert forecast.model_run_utc == _DT_00Z.replace(hour=hour)
 
 
 class TestParseFlatBuffersResponse:
     """Tests for parsing FlatBuffers API responses (openmeteo_requests library)."""
 
-    def test_parses_basic_flatbuffers_response(self):
+    def test_parses_basic_flatbuffers_response(self, default_forecast):
         """Test parsing a basic FlatBuffers response."""
-        response = MockFlatBuffersResponse()
-
-        forecast = parse_openmeteo_response(
-            response=response,
-            requested_lat=43.48,
-            requested_lon=-110.76,
-            model_id="gfs",
-        )
-
-        assert isinstance(forecast, Forecast)
-        assert forecast.lat == 43.48
-        assert forecast.lon == -110.76
-        assert forecast.api_lat == 43.5
-        assert forecast.api_lon == -110.75
-        assert forecast.elevation_m == 3000.0
-        assert forecast.model_id == "gfs"
-
-    def test_parses_hourly_times(self):
+        assert isinstance(default_forecast, Forecast)
+        assert default_forecast.lat == 43.48
+        assert default_forecast.lon == -110.76
+        assert default_forecast.api_lat == 43.5
+        assert default_forecast.api_lon == -110.75
+        assert default_forecast.elevation_m == 3000.0
+        assert default_forecast.model_id == "gfs"
+
+    def test_parses_hourly_times(self, default_forecast):
         """Test that hourly timestamps are correctly parsed."""
-        response = MockFlatBuffersResponse()
-
-        forecast = parse_openmeteo_response(
-            response=response,
-            requested_lat=43.48,
-            requested_lon=-110.76,
-            model_id="gfs",
-        )
-
         # Should have 24 hours of data
-        assert len(forecast.times_utc) == 24
-        assert forecast.times_utc[0] == datetime(2024, 1, 15, 0, 0, tzinfo=timezone.utc)
-        assert forecast.times_utc[1] == datetime(2024, 1, 15, 1, 0, tzinfo=timezone.utc)
+        assert len(default_forecast.times_utc) == 24
+        assert default_forecast.times_utc[0] == _DT_00Z
+        assert default_forecast.times_utc[1] == _DT_01Z
 
-    def test_parses_variable_data(self):
+    def test_parses_variable_data(self, default_forecast):
         """Test that variable data is correctly extracted."""
-        response = MockFlatBuffersResponse()
-
-        forecast = parse_openmeteo_response(
-            response=response,
-            requested_lat=43.48,
-            requested_lon=-110.76,
-            model_id="gfs",
-        )
-
         # Check temperature data
-        assert "temperature_2m" in forecast.hourly_data
-        assert forecast.hourly_data["temperature_2m"][0] == -5.0
+        assert "temperature_2m" in default_forecast.hourly_data
+        assert default_forecast.hourly_data["temperature_2m"][0] == -5.0
 
         # Check snowfall data
-        assert "snowfall" in forecast.hourly_data
-        assert forecast.hourly_data["snowfall"][0] == 0.5
+        assert "snowfall" in default_forecast.hourly_data
+        assert default_forecast.hourly_data["snowfall"][0] == 0.5
 
-    def test_parses_unit_enums(self):
+    def test_parses_unit_enums(self, default_forecast):
         """Test that unit enums are correctly decoded."""
-        response = MockFlatBuffersResponse()
-
-        forecast = parse_openmeteo_response(
-            response=response,
-            requested_lat=43.48,
-            requested_lon=-110.76,
-            model_id="gfs",
-        )
-
-        assert forecast.hourly_units["temperature_2m"] == "C"
-        assert forecast.hourly_units["wind_speed_10m"] == "kmh"
-        assert forecast.hourly_units["snowfall"] == "cm"
-        assert forecast.hourly_units["precipitation"] == "mm"
-        assert forecast.hourly_units["freezing_level_height"] == "m"
+        assert default_forecast.hourly_units["temperature_2m"] == "C"
+        assert default_forecast.hourly_units["wind_speed_10m"] == "kmh"
+        assert default_forecast.hourly_units["snowfall"] == "cm"
+        assert default_forecast.hourly_units["precipitation"] == "mm"
+        assert default_forecast.hourly_units["freezing_level_height"] == "m"
 
     def test_respects_requested_hourly_order_for_units(self, caplog):
         """Ensure units stay aligned when hourly variable order changes."""
-        hours = 3
-        time_start = int(datetime(2024, 1, 15, 0, tzinfo=timezone.utc).timestamp())
-        time_end = time_start + hours * 3600
-
-        # Insert an extra temperature variable before snowfall to mimic client-side order.
-        requested_hourly = (
-            "temperature_2m",
-            "wind_speed_10m",
-            "wind_gusts_10m",
-            "apparent_temperature",  # extra temperature variable
-            "snowfall",
-            "precipitation",
-            "freezing_level_height",
-        )
-
-        variables = {
-            0: (np.array([-5.0, -4.5, -4.0]), 1),  # temperature_2m (C)
-            1: (np.array([20.0, 21.0, 22.0]), 8),  # wind_speed_10m (kmh)
-            2: (np.array([30.0, 31.0, 32.0]), 8),  # wind_gusts_10m (kmh)
-            3: (np.array([12.0, 13.0, 14.0]), 2),  # apparent_temperature (F)
-            4: (np.array([0.5, 0.7, 1.0]), 4),     # snowfall (cm)
-            5: (np.array([1.0, 1.1, 1.2]), 3),     # precipitation (mm)
-            6: (np.array([2000.0, 2005.0, 2010.0]), 5),  # freezing_level_height (m)
-        }
-
         hourly = MockHourly(
-            time_start=time_start,
-            time_end=time_end,
+            time_start=_TS_START,
+            time_end=_TS_PLUS_3H,
             interval=3600,
-            variables=variables,
+            variables=_MISALIGNED_VARIABLES,
         )
         response = MockFlatBuffersResponse(hourly=hourly)
 
@@ -488,7 +457,7 @@ class TestParseFlatBuffersResponse:
                 requested_lat=43.48,
                 requested_lon=-110.76,
                 model_id="gfs",
-                hourly_variables=requested_hourly,
+                hourly_variables=_REQ_HOURLY_ORDER,
             )
 
         # Snowfall should use the cm unit and not inherit the Fahrenheit unit.
@@ -513,17 +482,11 @@ class TestParseFlatBuffersResponse:
 
     def test_handles_nan_values(self):
         """Test that NaN values are converted to None."""
-        time_start = int(datetime(2024, 1, 15, 0, tzinfo=timezone.utc).timestamp())
-        time_end = int(datetime(2024, 1, 15, 3, tzinfo=timezone.utc).timestamp())
-
-        # Create array with NaN
-        values_with_nan = np.array([1.0, np.nan, 3.0])
-
         hourly = MockHourly(
-            time_start=time_start,
-            time_end=time_end,
+            time_start=_TS_START,
+            time_end=_TS_PLUS_3H,
             variables={
-                0: (values_with_nan, 1),  # temp with NaN
+                0: (_NAN_ARRAY, 1),  # temp with NaN
             },
         )
         response = MockFlatBuffersResponse(hourly=hourly)
@@ -545,7 +508,7 @@ class TestParseFlatBuffersResponse:
         response = MockFlatBuffersResponse()
         response._hourly = None
 
-        with pytest.raises(ApiError) as exc_info:
+        with pytest.raises(ApiError, match="(?i)hourly"):
             parse_openmeteo_response(
                 response=response,
                 requested_lat=43.48,
@@ -553,19 +516,17 @@ class TestParseFlatBuffersResponse:
                 model_id="gfs",
             )
 
-        assert "hourly" in str(exc_info.value).lower()
-
     def test_missing_variable_skipped(self):
         """Test that missing variables are gracefully skipped."""
-        time_start = int(datetime(2024, 1, 15, 0, tzinfo=timezone.utc).timestamp())
-        time_end = int(datetime(2024, 1, 15, 3, tzinfo=timezone.utc).timestamp())
+        time_start = _TS_START
+        time_end = _TS_PLUS_3H
 
         # Only provide temperature, skip others
         hourly = MockHourly(
             time_start=time_start,
             time_end=time_end,
             variables={
-                0: (np.array([1.0, 2.0, 3.0]), 1),  # Only temperature
+                0: (np.array([1.0, 2.0, 3.0], dtype=np.float64), 1),  # Only temperature
             },
         )
         response = MockFlatBuffersResponse(hourly=hourly)
@@ -581,13 +542,12 @@ class TestParseFlatBuffersResponse:
         assert "temperature_2m" in forecast.hourly_data
         assert "wind_speed_10m" not in forecast.hourly_data
 
-    def test_infers_model_run_time(self):
-        """Test that model run time is inferred from timestamps."""
-        # 06Z run
-        time_start = int(datetime(2024, 1, 15, 6, tzinfo=timezone.utc).timestamp())
-        time_end = int(datetime(2024, 1, 15, 12, tzinfo=timezone.utc).timestamp())
+    @pytest.mark.parametrize("hour", [0, 6, 12])
+    def test_infers_model_run_time(self, hour):
+        """Test that the model run is inferred from the first timestamp."""
+        time_start = _TS_START + hour * 3600
 
-        hourly = MockHourly(time_start=time_start, time_end=time_end, variables={})
+        hourly = MockHourly(time_start=time_start, time_end=time_start + 6 * 3600, variables={})
         response = MockFlatBuffersResponse(hourly=hourly)
 
         forecast = parse_openmeteo_response(
@@ -597,7 +557,7 @@ class TestParseFlatBuffersResponse:
             model_id="gfs",
         )
 
-        assert forecast.model_run_utc == datetime(2024, 1, 15, 6, 0, tzinfo=timezone.utc)
+        assert forecast.model_run_utc == _DT_00Z.replace(hour=hour)
 
 
 class TestUnknownResponseType:
@@ -607,7 +567,7 @@ class TestUnknownResponseType:
         """Test that unknown response type raises ApiError."""
         response = "not a valid response"
 
-        with pytest.raises(ApiError) as exc_info:
+        with pytest.raises(ApiError, match="Unknown response type"):
             parse_openmeteo_response(
                 response=response,
                 requested_lat=43.48,
@@ -615,13 +575,11 @@ class TestUnknownResponseType:
                 model_id="gfs",
             )
 
-        assert "Unknown response type" in str(exc_info.value)
-
     def test_list_type_raises_error(self):
         """Test that list response type raises ApiError."""
         response = [1, 2, 3]
 
-        with pytest.raises(ApiError) as exc_info:
+        with pytest.raises(ApiError, match="Unknown response type"):
             parse_openmeteo_response(
                 response=response,
                 requested_lat=43.48,
@@ -629,5 +587,3 @@ class TestUnknownResponseType:
                 model_id="gfs",
             )
 
-        assert "Unknown response type" in str(exc_info.value)
-
@@ -260,6 +260,19 @@ class TestSeries:
         assert s.min() == -10.0
         assert s.max() == 10.0
 
+    def test_aggregates_return_python_floats(self):
+        """Test that aggregates are plain floats, not numpy scalars."""
+        s = Series(values=(1.0, None, 3.0), unit="C")
+        for result in (s.sum(), s.mean(), s.min(), s.max()):
+            assert type(result) is float
+
+    def test_equality_ignores_cached_array(self):
+        """Test that computing an aggregate does not affect equality."""
+        s1 = Series(values=(1.0, 2.0, 3.0), unit="C")
+        s2 = Series(values=(1.0, 2.0, 3.0), unit="C")
+        s1.sum()
+        assert s1 == s2
+
     def test_equality(self):
         """Test Series equality."""
         s1 = Series(values=(1.0, 2.0, 3.0), unit="C")
@@ -1,5 +1,8 @@
 """Tests for range total calculations."""
 
+import dataclasses
+from functools import lru_cache
+
 import pytest
 from datetime import datetime, timedelta, timezone
 
@@ -7,16 +10,21 @@ from weather.domain.forecast import Forecast
 from weather.domain.errors import RangeError
 
 
+@lru_cache(maxsize=8)
 def create_test_forecast(hours: int = 48) -> Forecast:
-    """Create a test forecast with predictable data."""
+    """Create a test forecast with predictable data.
+
+    Cached per length, so tests share one instance; copy it with
+    dataclasses.replace before changing any field.
+    """
     base_time = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
     times_utc = [base_time + timedelta(hours=h) for h in range(hours)]
 
     # Create predictable snowfall: 1mm per hour
-    snowfall = tuple(1.0 for _ in range(hours))
+    snowfall = (1.0,) * hours
 
     # Create predictable precipitation: 2mm per hour
-    precipitation = tuple(2.0 for _ in range(hours))
+    precipitation = (2.0,) * hours
 
     return Forecast(
         lat=43.48,
@@ -174,7 +182,9 @@ class TestRangeTotalsErrors:
         """Test that missing variable raises KeyError."""
         forecast = create_test_forecast(48)
         # Remove precipitation data
-        forecast.hourly_data = {"snowfall": forecast.hourly_data["snowfall"]}
+        forecast = dataclasses.replace(
+            forecast, hourly_data={"snowfall": forecast.hourly_data["snowfall"]}
+        )
 
         with pytest.raises(KeyError):
             forecast.get_precipitation_total(unit="mm")
@@ -200,3 +210,18 @@ class TestPrecipitationTotals:
         assert abs(total.value - 1.89) < 0.02
         assert total.unit == "in"
 
+
+class TestRangeTotalsCache:
+    """Tests for the cached arrays behind range totals."""
+
+    def test_total_follows_replaced_hourly_data(self):
+        """Test that totals see a replaced hourly_data entry, like the getters."""
+        base = create_test_forecast(24)
+        forecast = dataclasses.replace(base, hourly_data=dict(base.hourly_data))
+
+        assert forecast.get_snowfall_total(unit="cm").value == 24.0
+
+        forecast.hourly_data["snowfall"] = (2.0,) * 24
+
+        assert forecast.get_snowfall_total(unit="cm").value == 48.0
+        assert forecast.get_snowfall(unit="cm").sum() == 48.0
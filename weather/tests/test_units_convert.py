@@ -198,3 +198,44 @@ class TestConvertSeries:
         assert result.unit == "mm"
         assert result.values == series.values
 
+    @pytest.mark.parametrize(
+        "from_unit,to_unit",
+        [
+            ("C", "F"),
+            ("F", "K"),
+            ("K", "C"),
+            ("kmh", "mph"),
+            ("kn", "ms"),
+            ("cm", "in"),
+            ("ft", "mm"),
+        ],
+    )
+    def test_matches_scalar_conversion(self, from_unit, to_unit):
+        """Test that series conversion agrees with convert_value per element."""
+        values = (-40.0, 0.0, 12.5, None, 300.0)
+        result = convert_series(Series(values=values, unit=from_unit), to_unit)
+
+        expected = [
+            None if v is None else convert_value(v, from_unit, to_unit) for v in values
+        ]
+        assert list(result.values) == expected
+
+    @pytest.mark.parametrize(
+        "value,from_unit,to_unit",
+        [
+            (25.4, "mm", "in"),
+            (0.3048, "m", "ft"),
+            (33.8, "F", "C"),
+        ],
+    )
+    def test_round_values_match_scalar_conversion(self, value, from_unit, to_unit):
+        """Test that values landing on round numbers round like convert_value."""
+        result = convert_series(Series(values=(value,), unit=from_unit), to_unit)
+
+        assert result.values[0] == convert_value(value, from_unit, to_unit)
+
+    def test_incompatible_units_raise(self):
+        """Test that converting to an incompatible unit raises UnitError."""
+        series = Series(values=(1.0, 2.0), unit="mm")
+        with pytest.raises(UnitError, match="incompatible"):
+            convert_series(series, "C")
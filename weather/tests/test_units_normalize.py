@@ -66,6 +66,19 @@ class TestNormalizeUnit:
         assert normalize_unit("Fahrenheit") == "F"
         assert normalize_unit("KM/H") == "kmh"
 
+    def test_aliases_share_interned_token(self):
+        """Test that every spelling of a unit resolves to the same string object."""
+        assert normalize_unit("km/h") is normalize_unit("KPH") is normalize_unit("kmh")
+        assert normalize_unit("percent") is normalize_unit("%")
+
+    def test_repeated_normalize_is_cached(self):
+        """Test that normalizing the same unit twice hits the cache."""
+        normalize_unit("km/h")
+        hits = normalize_unit.cache_info().hits
+
+        assert normalize_unit("km/h") == "kmh"
+        assert normalize_unit.cache_info().hits == hits + 1
+
     def test_unknown_unit_raises(self):
         """Test that unknown units raise UnitError."""
         with pytest.raises(UnitError) as exc_info:
@@ -2,14 +2,35 @@
 
 import pytest
 import math
+import numpy as np
 from weather.utils.geo import (
     haversine_distance,
+    haversine_distance_batch,
+    make_haversine_from,
     coords_are_equivalent,
     round_coords,
+    round_coords_batch,
     normalize_longitude,
 )
 
 
+# (lat1, lon1, lat2, lon2, low, high): distance must lie strictly within (low, high) meters
+HAVERSINE_CASES = [
+    # New York City to Los Angeles, ~3940 km within 1%
+    (40.7128, -74.0060, 34.0522, -118.2437, 3_900_600, 3_979_400),
+    # London to Paris, ~344 km within 2%
+    (51.5074, -0.1278, 48.8566, 2.3522, 337_120, 350_880),
+    # 0.001 degrees latitude at the equator, ~111 m
+    (0.0, 0.0, 0.001, 0.0, 100, 120),
+    # 2 degrees longitude at 51N across the prime meridian, ~140 km
+    (51.0, -1.0, 51.0, 1.0, 130_000, 150_000),
+    # 2 degrees at the equator across the date line, ~222 km
+    (0.0, 179.0, 0.0, -179.0, 200_000, 250_000),
+    # North pole to south pole, half the circumference ~20,000 km within 1%
+    (90.0, 0.0, -90.0, 0.0, 19_800_000, 20_200_000),
+]
+
+
 class TestHaversineDistance:
     """Tests for haversine_distance function."""
 
@@ -18,30 +39,11 @@ class TestHaversineDistance:
         distance = haversine_distance(43.5, -110.75, 43.5, -110.75)
         assert distance == 0.0
 
-    def test_known_distance_new_york_to_la(self):
-        """Test against known distance (NYC to LA ~3940 km)."""
-        # New York City
-        nyc_lat, nyc_lon = 40.7128, -74.0060
-        # Los Angeles
-        la_lat, la_lon = 34.0522, -118.2437
-
-        distance = haversine_distance(nyc_lat, nyc_lon, la_lat, la_lon)
-        # Expected ~3940 km, allow 1% error
-        expected_km = 3940
-        actual_km = distance / 1000
-        assert abs(actual_km - expected_km) < expected_km * 0.01
-
-    def test_known_distance_london_to_paris(self):
-        """Test against known distance (London to Paris ~344 km)."""
-        # London
-        london_lat, london_lon = 51.5074, -0.1278
-        # Paris
-        paris_lat, paris_lon = 48.8566, 2.3522
-
-        distance = haversine_distance(london_lat, london_lon, paris_lat, paris_lon)
-        expected_km = 344
-        actual_km = distance / 1000
-        assert abs(actual_km - expected_km) < expected_km * 0.02
+    @pytest.mark.parametrize("lat1,lon1,lat2,lon2,low,high", HAVERSINE_CASES)
+    def test_distance_in_expected_range(self, lat1, lon1, lat2, lon2, low, high):
+        """Test distances against known values (bounds in meters)."""
+        distance = haversine_distance(lat1, lon1, lat2, lon2)
+        assert low < distance < high
 
     def test_symmetry(self):
         """Test that distance is symmetric (A to B == B to A)."""
@@ -52,43 +54,54 @@ class TestHaversineDistance:
         dist_ba = haversine_distance(lat2, lon2, lat1, lon1)
         assert dist_ab == dist_ba
 
-    def test_short_distance_meters(self):
-        """Test short distances (should be in meters)."""
-        # Two points about 111 meters apart (0.001 degrees latitude)
-        lat1, lon1 = 0.0, 0.0
-        lat2, lon2 = 0.001, 0.0
 
-        distance = haversine_distance(lat1, lon1, lat2, lon2)
-        # At equator, 0.001 degrees ≈ 111 meters
-        assert 100 < distance < 120
+class TestHaversineDistanceBatch:
+    """Tests for haversine_distance_batch function."""
 
-    def test_across_prime_meridian(self):
-        """Test distance calculation across prime meridian."""
-        lat1, lon1 = 51.0, -1.0
-        lat2, lon2 = 51.0, 1.0
+    # Point pairs from HAVERSINE_CASES plus a coincident and a symmetric pair
+    PAIRS = (
+        (43.5, -110.75, 43.5, -110.75),
+        (43.5, -110.75, 44.0, -111.0),
+        *(case[:4] for case in HAVERSINE_CASES),
+    )
 
-        distance = haversine_distance(lat1, lon1, lat2, lon2)
-        # Should be a reasonable positive distance
-        assert distance > 0
-        # About 140 km for 2 degrees longitude at 51°N
-        assert 130000 < distance < 150000
+    def test_batch_matches_scalar(self):
+        """Test that batch distances match the scalar function."""
+        lat1, lon1, lat2, lon2 = np.array(self.PAIRS, dtype=np.float64).T
 
-    def test_across_date_line(self):
-        """Test distance calculation across international date line."""
-        lat1, lon1 = 0.0, 179.0
-        lat2, lon2 = 0.0, -179.0
+        distances = haversine_distance_batch(lat1, lon1, lat2, lon2)
 
-        distance = haversine_distance(lat1, lon1, lat2, lon2)
-        # 2 degrees at equator ≈ 222 km
-        assert 200000 < distance < 250000
+        expected = [haversine_distance(*pair) for pair in self.PAIRS]
+        np.testing.assert_allclose(distances, expected, rtol=1e-12, atol=1e-9)
+
+    def test_broadcasts_single_reference_point(self):
+        """Test that one point broadcasts against many."""
+        lats = np.array([43.5, 44.0, 45.0])
+        lons = np.array([-110.75, -111.0, -112.0])
+
+        distances = haversine_distance_batch(43.5, -110.75, lats, lons)
+
+        assert distances.shape == (3,)
+        assert distances[0] == 0.0
+        assert distances[1] == pytest.approx(haversine_distance(43.5, -110.75, 44.0, -111.0))
+
+
+class TestMakeHaversineFrom:
+    """Tests for make_haversine_from function."""
+
+    @pytest.mark.parametrize("lat1,lon1,lat2,lon2,low,high", HAVERSINE_CASES)
+    def test_matches_haversine_distance(self, lat1, lon1, lat2, lon2, low, high):
+        """Test that the anchored function agrees with haversine_distance."""
+        distance_from = make_haversine_from(lat1, lon1)
 
-    def test_poles(self):
-        """Test distance from north pole to south pole."""
-        distance = haversine_distance(90.0, 0.0, -90.0, 0.0)
-        # Half Earth's circumference ≈ 20,000 km
-        expected_km = 20000
-        actual_km = distance / 1000
-        assert abs(actual_km - expected_km) < expected_km * 0.01
+        assert distance_from(lat2, lon2) == pytest.approx(
+            haversine_distance(lat1, lon1, lat2, lon2), rel=1e-12
+        )
+
+    def test_anchor_to_itself_is_zero(self):
+        """Test that the reference point is at zero distance from itself."""
+        distance_from = make_haversine_from(43.5, -110.75)
+        assert distance_from(43.5, -110.75) == 0.0
 
 
 class TestCoordsAreEquivalent:
@@ -137,6 +150,16 @@ class TestCoordsAreEquivalent:
         # Equivalent at 1000m
         assert coords_are_equivalent(lat1, lon1, lat2, lon2, threshold_meters=1000)
 
+    def test_across_date_line(self):
+        """Test that nearby points on either side of the date line are equivalent."""
+        # ~111m apart at the equator despite a 359.999 degree longitude difference
+        assert coords_are_equivalent(0.0, 179.9995, 0.0, -179.9995, threshold_meters=200)
+
+    def test_large_latitude_gap_not_equivalent(self):
+        """Test that a latitude gap beyond the threshold is rejected."""
+        assert not coords_are_equivalent(43.5, -110.75, 44.5, -110.75, threshold_meters=100_000)
+        assert coords_are_equivalent(43.5, -110.75, 44.5, -110.75, threshold_meters=112_000)
+
     def test_exact_threshold_boundary(self):
         """Test behavior at exact threshold boundary."""
         # Use a known distance and exact threshold
@@ -195,6 +218,36 @@ class TestRoundCoords:
         assert lon == -110.988
 
 
+class TestRoundCoordsBatch:
+    """Tests for round_coords_batch function."""
+
+    LATS = np.linspace(-90.0, 90.0, 1000)
+    LONS = np.linspace(-180.0, 180.0, 1000)
+
+    @pytest.mark.parametrize("precision", [0, 2, 3, 4, 6])
+    def test_matches_scalar(self, precision):
+        """Test that batch rounding matches round_coords element-wise."""
+        lats, lons = round_coords_batch(self.LATS, self.LONS, precision=precision)
+
+        expected = [
+            round_coords(lat, lon, precision)
+            for lat, lon in zip(self.LATS.tolist(), self.LONS.tolist(), strict=True)
+        ]
+        assert list(zip(lats.tolist(), lons.tolist(), strict=True)) == expected
+
+    def test_default_precision_4(self):
+        """Test default precision is 4 decimal places."""
+        lats, lons = round_coords_batch([43.123456789], [-110.987654321])
+        assert lats.tolist() == [43.1235]
+        assert lons.tolist() == [-110.9877]
+
+    def test_returns_float64_arrays(self):
+        """Test that list input comes back as float64 arrays."""
+        lats, lons = round_coords_batch([43, 44], [-110, -111])
+        assert lats.dtype == np.float64
+        assert lons.dtype == np.float64
+
+
 class TestNormalizeLongitude:
     """Tests for normalize_longitude function."""
 
@@ -244,3 +297,58 @@ class TestNormalizeLongitude:
         result = normalize_longitude(-180.5)
         assert result == 179.5
 
+
+    def test_odd_multiples_of_180_keep_sign(self):
+        """Test that wrapped odd multiples of 180 stay on the input's side."""
+        assert normalize_longitude(540.0) == 180.0
+        assert normalize_longitude(-540.0) == -180.0
+        assert normalize_longitude(900.0) == 180.0
+
+
+class TestGeoProperties:
+    """Property checks over a fixed pseudo-random sample of coordinates."""
+
+    _RNG = np.random.default_rng(20240115)
+    LATS1 = _RNG.uniform(-90.0, 90.0, 200).tolist()
+    LONS1 = _RNG.uniform(-180.0, 180.0, 200).tolist()
+    LATS2 = _RNG.uniform(-90.0, 90.0, 200).tolist()
+    LONS2 = _RNG.uniform(-180.0, 180.0, 200).tolist()
+    LONGITUDES = _RNG.uniform(-1e6, 1e6, 200).tolist()
+
+    def test_haversine_is_symmetric(self):
+        """Test that A to B equals B to A for every sampled pair."""
+        pairs = zip(self.LATS1, self.LONS1, self.LATS2, self.LONS2, strict=True)
+        for lat1, lon1, lat2, lon2 in pairs:
+            assert math.isclose(
+                haversine_distance(lat1, lon1, lat2, lon2),
+                haversine_distance(lat2, lon2, lat1, lon1),
+                rel_tol=1e-9,
+            )
+
+    def test_haversine_to_self_is_zero(self):
+        """Test that every sampled point is at zero distance from itself."""
+        for lat, lon in zip(self.LATS1, self.LONS1, strict=True):
+            assert haversine_distance(lat, lon, lat, lon) == 0.0
+
+    def test_haversine_bounded_by_half_circumference(self):
+        """Test that no distance exceeds half the Earth's circumference."""
+        distances = haversine_distance_batch(self.LATS1, self.LONS1, self.LATS2, self.LONS2)
+        assert (distances >= 0).all()
+        assert (distances <= math.pi * 6_371_000 * (1 + 1e-12)).all()
+
+    def test_normalize_longitude_in_range_and_idempotent(self):
+        """Test that normalized longitudes are in range and stable."""
+        for lon in self.LONGITUDES:
+            normalized = normalize_longitude(lon)
+            assert -180.0 <= normalized <= 180.0
+            assert normalize_longitude(normalized) == normalized
+
+    @pytest.mark.parametrize("rotations", [-3, -1, 1, 2])
+    def test_normalize_longitude_is_periodic(self, rotations):
+        """Test that adding whole rotations does not change the result."""
+        for lon in self.LONS1:
+            assert math.isclose(
+                normalize_longitude(lon + 360.0 * rotations),
+                normalize_longitude(lon),
+                abs_tol=1e-9,
+            )
@@ -10,10 +10,18 @@ from weather.utils.time import (
     get_time_index,
     slice_time_range,
     format_duration,
+    times_to_epoch,
 )
 from weather.domain.errors import RangeError
 
 
+@pytest.fixture(scope="module")
+def hourly_times_48():
+    """48 hourly UTC times from 2024-01-15 00Z, built once; do not mutate."""
+    base = datetime(2024, 1, 15, 0, 0, tzinfo=timezone.utc)
+    return [base + timedelta(hours=h) for h in range(48)]
+
+
 class TestEnsureUtc:
     """Tests for ensure_utc function."""
 
@@ -24,6 +32,21 @@ class TestEnsureUtc:
         assert result == dt
         assert result.tzinfo == timezone.utc
 
+    def test_utc_datetime_returned_as_is(self):
+        """Test that a datetime already in UTC is returned without copying."""
+        dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+        assert ensure_utc(dt) is dt
+
+    def test_zero_offset_timezone_normalized_to_utc(self):
+        """Test that a zero-offset timezone is normalized to timezone.utc."""
+        gmt = timezone(timedelta(0), "GMT")
+        dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=gmt)
+
+        result = ensure_utc(dt)
+
+        assert result == dt
+        assert result.tzinfo is timezone.utc
+
     def test_converts_other_timezone_to_utc(self):
         """Test conversion from other timezone to UTC."""
         # EST is UTC-5
@@ -143,6 +166,29 @@ class TestInferModelRunTime:
         assert result.second == 0
         assert result.microsecond == 0
 
+    def test_repeated_first_time_is_cached(self):
+        """Test that forecasts sharing a first timestamp reuse the cached run time."""
+        first = datetime(2024, 1, 15, 14, 0, tzinfo=timezone.utc)
+
+        result1 = infer_model_run_time([first, first + timedelta(hours=1)])
+        result2 = infer_model_run_time([first])
+
+        assert result1 is result2
+
+    def test_equal_instants_in_other_zones_give_utc_run(self):
+        """Test that a cached non-UTC timestamp does not leak into a UTC lookup."""
+        est = timezone(timedelta(hours=-5))
+        first_est = datetime(2024, 1, 15, 9, 0, tzinfo=est)
+        first_utc = datetime(2024, 1, 15, 14, 0, tzinfo=timezone.utc)
+
+        result_est = infer_model_run_time([first_est])
+        result_utc = infer_model_run_time([first_utc])
+
+        expected = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        assert result_est == expected
+        assert result_utc == expected
+        assert result_utc.utcoffset() == timedelta(0)
+
 
 class TestResolveTimeOffset:
     """Tests for resolve_time_offset function."""
@@ -192,10 +238,9 @@ class TestGetTimeIndex:
     """Tests for get_time_index function."""
 
     @pytest.fixture
-    def sample_times(self):
-        """Sample hourly times for testing."""
-        base = datetime(2024, 1, 15, 0, 0, tzinfo=timezone.utc)
-        return [base + timedelta(hours=h) for h in range(24)]
+    def sample_times(self, hourly_times_48):
+        """Sample hourly times for testing (first 24 shared hours)."""
+        return hourly_times_48[:24]
 
     def test_exact_match(self, sample_times):
         """Test finding exact time match."""
@@ -254,15 +299,43 @@ class TestGetTimeIndex:
         result = get_time_index(target, sample_times)
         assert result == 23
 
+    def test_epoch_is_exact_microseconds(self):
+        """Test that epoch values keep sub-second and pre-1970 times exact."""
+        times = [
+            datetime(1969, 12, 31, 23, 59, 59, 500_000, tzinfo=timezone.utc),
+            datetime(2024, 1, 15, 0, 0, 0, 500_000, tzinfo=timezone.utc),
+        ]
+
+        assert times_to_epoch(times).tolist() == [-500_000, 1_705_276_800_500_000]
+
+    def test_epoch_lookup_matches_datetime_lookup_sub_second(self):
+        """Test that epoch and datetime lookups agree for sub-second times and targets."""
+        start = datetime(2024, 1, 15, 23, 0, 0, 856_379, tzinfo=timezone.utc)
+        times = [start + timedelta(hours=h) for h in range(6)]
+        times_epoch = times_to_epoch(times)
+
+        offsets = [
+            timedelta(seconds=-0.34),
+            timedelta(microseconds=-1),
+            timedelta(0),
+            timedelta(microseconds=1),
+            timedelta(seconds=0.34),
+        ]
+        for t in times:
+            for offset in offsets:
+                target = t + offset
+                assert get_time_index(target, times, times_epoch=times_epoch) == (
+                    get_time_index(target, times)
+                ), target
+
 
 class TestSliceTimeRange:
     """Tests for slice_time_range function."""
 
     @pytest.fixture
-    def sample_times(self):
-        """Sample hourly times for testing."""
-        base = datetime(2024, 1, 15, 0, 0, tzinfo=timezone.utc)
-        return [base + timedelta(hours=h) for h in range(48)]
+    def sample_times(self, hourly_times_48):
+        """Sample hourly times for testing (shared; do not mutate)."""
+        return hourly_times_48
 
     def test_timedelta_range(self, sample_times):
         """Test slicing with timedelta offsets."""
@@ -327,6 +400,48 @@ class TestSliceTimeRange:
         assert start_idx == 40
         assert end_idx == 48  # Clamped to length
 
+    @pytest.mark.parametrize(
+        "start,end",
+        [
+            (timedelta(hours=0), timedelta(hours=24)),
+            (timedelta(hours=6, minutes=30), timedelta(hours=12, minutes=15)),
+            (timedelta(hours=-5), timedelta(hours=3)),
+            (timedelta(hours=40), timedelta(hours=100)),
+            (
+                datetime(2024, 1, 15, 6, 0, tzinfo=timezone.utc),
+                datetime(2024, 1, 15, 18, 0, tzinfo=timezone.utc),
+            ),
+        ],
+    )
+    def test_epoch_lookup_matches_datetime_lookup(self, sample_times, start, end):
+        """Test that the precomputed-epoch path gives the same indices."""
+        times_epoch = times_to_epoch(sample_times)
+
+        assert slice_time_range(start, end, sample_times, times_epoch=times_epoch) == (
+            slice_time_range(start, end, sample_times)
+        )
+
+    @pytest.mark.parametrize(
+        "start_offset,end_offset",
+        [
+            (timedelta(seconds=-0.34), timedelta(hours=5)),
+            (timedelta(0), timedelta(hours=3, seconds=-0.34)),
+            (timedelta(seconds=-0.34), timedelta(hours=3, seconds=-0.34)),
+            (timedelta(microseconds=1), timedelta(hours=3, microseconds=-1)),
+            (timedelta(seconds=0.34), timedelta(hours=3, seconds=0.34)),
+        ],
+    )
+    def test_epoch_lookup_matches_datetime_lookup_sub_second(self, start_offset, end_offset):
+        """Test that both bounds agree with the datetime path for sub-second times."""
+        first = datetime(2024, 1, 15, 23, 0, 0, 856_379, tzinfo=timezone.utc)
+        times = [first + timedelta(hours=h) for h in range(6)]
+        start = times[1] + start_offset
+        end = times[1] + end_offset
+
+        assert slice_time_range(start, end, times, times_epoch=times_to_epoch(times)) == (
+            slice_time_range(start, end, times)
+        )
+
 
 class TestFormatDuration:
     """Tests for format_duration function."""
@@ -360,3 +475,9 @@ class TestFormatDuration:
         # 14 days 12 hours
         assert format_duration(348) == "14d 12h"
 
+
+    def test_beyond_lookup_table(self):
+        """Test that values past the precomputed range are still formatted."""
+        assert format_duration(720) == "30d"
+        assert format_duration(721) == "30d 1h"
+        assert format_duration(10_000) == "416d 16h"